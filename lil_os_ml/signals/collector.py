@@ -52,7 +52,8 @@ class SignalCollector(ABC):
         self,
         signal_type: str,
         data: Dict[str, Any],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
     ) -> Signal:
         """
         Create a Signal object with current timestamp.
@@ -61,14 +62,21 @@ class SignalCollector(ABC):
             signal_type: Type of signal (e.g., "commit", "validation_report")
             data: Signal data
             metadata: Optional metadata
+            timestamp: Precomputed timestamp, so a batch of signals can share
+                one instead of formatting the current time per signal
             
         Returns:
             Signal object
         """
         return Signal(
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=timestamp or self._now(),
             source=self.source_name,
             signal_type=signal_type,
             data=data,
             metadata=metadata
         )
+    
+    @staticmethod
+    def _now() -> str:
+        """Current UTC time as an ISO 8601 signal timestamp."""
+        return datetime.utcnow().isoformat() + "Z"
@@ -7,14 +7,26 @@ Collects signals from git commits, diffs, and file changes.
 
 from __future__ import annotations
 
+import shutil
 import subprocess
-import re
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 from .collector import SignalCollector, Signal
 
 
+# Absolute path to git, resolved once instead of walking PATH on every call
+_GIT = shutil.which("git")
+
+# Separator between header fields in `git log -z` output (ASCII unit separator)
+_FIELD_SEP = b"\x1f"
+_LOG_FORMAT = "%H%x1f%an%x1f%ae%x1f%ad%x1f%s"
+
+# Bytes read from git's stdout per chunk when streaming output
+_READ_CHUNK_SIZE = 64 * 1024
+
+
 class GitSignalCollector(SignalCollector):
     """Collects signals from git repository."""
     
@@ -28,11 +40,14 @@ class GitSignalCollector(SignalCollector):
         super().__init__("git")
         self.repo_path = repo_path or Path.cwd()
     
+    @cached_property
     def _is_git_repo(self) -> bool:
-        """Check if current directory is a git repository."""
+        """Check if repo_path is a git repository (computed once per collector)."""
+        if _GIT is None:
+            return False
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
+            subprocess.run(
+                [_GIT, "rev-parse", "--git-dir"],
                 cwd=self.repo_path,
                 capture_output=True,
                 check=True
@@ -41,19 +56,31 @@ class GitSignalCollector(SignalCollector):
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
     
-    def _run_git_command(self, command: List[str]) -> Optional[str]:
-        """Run a git command and return output."""
-        try:
-            result = subprocess.run(
-                ["git"] + command,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return None
+    def _iter_git_records(self, command: List[str]) -> Iterator[bytes]:
+        """
+        Run a git command and stream its NUL-delimited output records.
+        
+        Output is read in fixed-size chunks and split as it arrives, so
+        large logs are never buffered whole.
+        
+        Raises:
+            subprocess.CalledProcessError: If git exits with a non-zero status
+        """
+        with subprocess.Popen(
+            [_GIT] + command,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        ) as proc:
+            pending = b""
+            for chunk in iter(lambda: proc.stdout.read(_READ_CHUNK_SIZE), b""):
+                *records, pending = (pending + chunk).split(b"\0")
+                yield from records
+            if pending:
+                yield pending
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, command)
     
     def collect_commits(self, limit: int = 50, since: Optional[str] = None) -> List[Signal]:
         """
@@ -66,84 +93,110 @@ class GitSignalCollector(SignalCollector):
         Returns:
             List of commit signals
         """
-        if not self._is_git_repo():
+        if not self._is_git_repo:
             return []
         
         signals = []
         
-        # Build git log command
-        cmd = ["log", "--pretty=format:%H|%an|%ae|%ad|%s", "--date=iso"]
+        # Build git log command. A single NUL-delimited invocation with
+        # --numstat yields both per-commit line counts and changed files.
+        cmd = ["log", "-z", f"--pretty=format:{_LOG_FORMAT}", "--numstat", "--date=iso"]
         if since:
             cmd.append(f"--since={since}")
         cmd.append(f"-{limit}")
         
-        log_output = self._run_git_command(cmd)
-        if not log_output:
+        try:
+            commits = self._parse_log_numstat(self._iter_git_records(cmd))
+        except (subprocess.CalledProcessError, FileNotFoundError):
             return []
         
-        for line in log_output.splitlines():
-            parts = line.split("|", 4)
-            if len(parts) < 5:
-                continue
-            
-            commit_hash, author_name, author_email, date, message = parts
-            
-            # Get commit stats
-            stats = self._get_commit_stats(commit_hash)
-            
-            # Get changed files
-            changed_files = self._get_changed_files(commit_hash)
-            
-            signal_data = {
-                "commit_hash": commit_hash,
-                "author_name": author_name,
-                "author_email": author_email,
-                "date": date,
-                "message": message,
-                "stats": stats,
-                "changed_files": changed_files,
-            }
-            
-            signals.append(self._create_signal("commit", signal_data))
+        # All commits from one collection pass share a timestamp
+        create_signal = self._create_signal
+        timestamp = self._now()
+        for signal_data in commits:
+            signals.append(create_signal("commit", signal_data, timestamp=timestamp))
         
         return signals
     
-    def _get_commit_stats(self, commit_hash: str) -> Dict[str, int]:
-        """Get commit statistics (lines added/deleted)."""
-        output = self._run_git_command(["show", "--stat", "--format=", commit_hash])
-        if not output:
-            return {"additions": 0, "deletions": 0, "files_changed": 0}
+    def _parse_log_numstat(self, records: Iterable[bytes]) -> List[Dict[str, Any]]:
+        """
+        Parse NUL-separated `git log -z --numstat` records into commits.
         
-        # Parse stat output
-        additions = 0
-        deletions = 0
-        files_changed = 0
+        Records are NUL-terminated. A commit header is followed by a newline
+        and its first numstat entry; further entries follow as separate
+        records and an empty record closes the commit. Commits without file
+        changes (e.g. merges) are a bare header. Renames report an empty path
+        followed by the old and new paths as two extra records.
+        """
+        commits: List[Dict[str, Any]] = []
+        current: Optional[Dict[str, Any]] = None
+        expect_header = True
+        rename_paths_pending = 0
         
-        for line in output.splitlines():
-            if "|" in line:
-                files_changed += 1
-                # Extract numbers from lines like " 5 files changed, 10 insertions(+), 2 deletions(-)"
-                match = re.search(r'(\d+)\s+insertions?', line)
-                if match:
-                    additions += int(match.group(1))
-                match = re.search(r'(\d+)\s+deletions?', line)
-                if match:
-                    deletions += int(match.group(1))
+        for record in records:
+            if rename_paths_pending:
+                rename_paths_pending -= 1
+                # Keep the destination path of a rename
+                if rename_paths_pending == 0 and current is not None:
+                    current["changed_files"].append(record.decode("utf-8", errors="replace"))
+                continue
+            
+            if expect_header:
+                if not record:
+                    continue
+                header, _, entry = record.partition(b"\n")
+                fields = header.split(_FIELD_SEP, 4)
+                if len(fields) < 5:
+                    current = None
+                    expect_header = not entry
+                    continue
+                
+                commit_hash, author_name, author_email, date, message = (
+                    f.decode("utf-8", errors="replace") for f in fields
+                )
+                current = {
+                    "commit_hash": commit_hash,
+                    "author_name": author_name,
+                    "author_email": author_email,
+                    "date": date,
+                    "message": message,
+                    "stats": {"additions": 0, "deletions": 0, "files_changed": 0, "total_lines": 0},
+                    "changed_files": [],
+                }
+                commits.append(current)
+                if not entry:
+                    # No numstat entries: the next record is another header
+                    continue
+                expect_header = False
+                record = entry
+            elif not record:
+                # Empty record terminates the current commit's entries
+                expect_header = True
+                continue
+            
+            parts = record.split(b"\t", 2)
+            if current is None or len(parts) < 3:
+                continue
+            
+            added, deleted, path = parts
+            stats = current["stats"]
+            stats["files_changed"] += 1
+            # Binary files report "-" instead of line counts
+            if added.isdigit():
+                stats["additions"] += int(added)
+            if deleted.isdigit():
+                stats["deletions"] += int(deleted)
+            if path:
+                current["changed_files"].append(path.decode("utf-8", errors="replace"))
+            else:
+                rename_paths_pending = 2
         
-        return {
-            "additions": additions,
-            "deletions": deletions,
-            "files_changed": files_changed,
-            "total_lines": additions + deletions
-        }
-    
-    def _get_changed_files(self, commit_hash: str) -> List[str]:
-        """Get list of changed files in a commit."""
-        output = self._run_git_command(["diff-tree", "--no-commit-id", "--name-only", "-r", commit_hash])
-        if not output:
-            return []
+        # Totals are derived once per commit rather than per numstat entry
+        for commit in commits:
+            stats = commit["stats"]
+            stats["total_lines"] = stats["additions"] + stats["deletions"]
         
-        return [f.strip() for f in output.splitlines() if f.strip()]
+        return commits
     
     def collect(self, limit: int = 50, since: Optional[str] = None, **kwargs) -> List[Signal]:
         """
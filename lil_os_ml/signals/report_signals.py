@@ -7,7 +7,10 @@ Collects signals from validation reports in .lil_os/reports/
 
 from __future__ import annotations
 
+import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -41,42 +44,62 @@ class ReportSignalCollector(SignalCollector):
         if not self.reports_dir.exists():
             return []
         
-        signals = []
-        report_files = sorted(
-            self.reports_dir.glob("*_report.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
+        # scandir skips building Path objects for non-report files; on POSIX
+        # DirEntry.stat() still costs one stat call per report (cached after)
+        with os.scandir(self.reports_dir) as it:
+            entries = [e for e in it if e.name.endswith("_report.json") and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
         
         if limit:
-            report_files = report_files[:limit]
+            entries = entries[:limit]
         
-        for report_file in report_files:
-            try:
-                with open(report_file, "r", encoding="utf-8") as f:
-                    report_data = json.load(f)
-                
-                signal_data = {
-                    "check_name": report_data.get("check_name", "unknown"),
-                    "status": report_data.get("status", "unknown"),
-                    "summary": report_data.get("summary", {}),
-                    "findings_count": len(report_data.get("findings", [])),
-                    "timing": report_data.get("timing", {}),
-                    "git_commit": report_data.get("git_commit"),
-                }
-                
-                metadata = {
-                    "report_file": str(report_file),
-                    "timestamp": report_data.get("timestamp"),
-                }
-                
-                signals.append(self._create_signal(
-                    "validation_report",
-                    signal_data,
-                    metadata=metadata
-                ))
-            except Exception:
-                # Skip corrupted files
-                continue
+        if not entries:
+            return []
+        
+        # Reports are read and parsed concurrently; map() preserves the
+        # newest-first ordering
+        report_files = [Path(e.path) for e in entries]
+        max_workers = min(32, os.cpu_count() or 1, len(report_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # All reports from one collection pass share a timestamp
+            results = executor.map(self._parse_report, report_files, repeat(self._now()))
+            return [signal for signal in results if signal is not None]
+    
+    def _parse_report(self, report_file: Path, timestamp: Optional[str] = None) -> Optional[Signal]:
+        """
+        Parse a single report file into a signal.
         
-        return signals
+        Args:
+            report_file: Path to a JSON validation report
+            timestamp: Precomputed signal timestamp
+            
+        Returns:
+            Report signal, or None if the file is corrupted
+        """
+        try:
+            with open(report_file, "rb") as f:
+                report_data = json.loads(f.read())
+            
+            signal_data = {
+                "check_name": report_data.get("check_name", "unknown"),
+                "status": report_data.get("status", "unknown"),
+                "summary": report_data.get("summary", {}),
+                "findings_count": len(report_data.get("findings", [])),
+                "timing": report_data.get("timing", {}),
+                "git_commit": report_data.get("git_commit"),
+            }
+            
+            metadata = {
+                "report_file": str(report_file),
+                "timestamp": report_data.get("timestamp"),
+            }
+            
+            return self._create_signal(
+                "validation_report",
+                signal_data,
+                metadata=metadata,
+                timestamp=timestamp
+            )
+        except Exception:
+            # Skip corrupted files
+            return None
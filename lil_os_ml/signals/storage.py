@@ -13,11 +13,61 @@ from datetime import datetime
 
 from .collector import Signal
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(value: Any) -> Any:
+    """Serialize a JSON value, as BLOB bytes when orjson is available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value)
+
+
+def _loads(value: Any) -> Any:
+    """Deserialize a JSON value stored as either TEXT or BLOB."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
 
 class SignalStorage:
     """SQLite storage for signals."""
     
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 2
+    
+    # Prepared-statement cache size per connection (sqlite3 default is 128)
+    CACHED_STATEMENTS = 256
+    
+    # SQL kept as constants so identical statement text hits the
+    # connection's prepared-statement cache
+    _SQL_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS signals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            source TEXT NOT NULL,
+            signal_type TEXT NOT NULL,
+            data TEXT NOT NULL,
+            metadata TEXT,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS idx_timestamp ON signals(timestamp);
+        CREATE INDEX IF NOT EXISTS idx_source ON signals(source);
+        CREATE INDEX IF NOT EXISTS idx_signal_type ON signals(signal_type);
+        -- Matches the get_signals() filter and ORDER BY timestamp DESC
+        CREATE INDEX IF NOT EXISTS idx_source_type_timestamp
+            ON signals(source, signal_type, timestamp DESC);
+        ANALYZE;
+    """
+    _SQL_INSERT = (
+        "INSERT INTO signals (timestamp, source, signal_type, data, metadata) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    _SQL_SELECT = "SELECT timestamp, source, signal_type, data, metadata FROM signals WHERE 1=1"
+    _SQL_COUNT = "SELECT COUNT(*) FROM signals WHERE 1=1"
     
     def __init__(self, db_path: Path):
         """
@@ -30,51 +80,24 @@ class SignalStorage:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the signals database."""
+        return sqlite3.connect(self.db_path, cached_statements=self.CACHED_STATEMENTS)
+    
     def _init_db(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create signals table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS signals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                source TEXT NOT NULL,
-                signal_type TEXT NOT NULL,
-                data TEXT NOT NULL,
-                metadata TEXT,
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create indexes
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_timestamp ON signals(timestamp)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_source ON signals(source)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_signal_type ON signals(signal_type)
-        """)
-        
-        # Create schema version table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS schema_version (
-                version INTEGER PRIMARY KEY,
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Check schema version
-        cursor.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1")
-        result = cursor.fetchone()
-        if result is None:
-            cursor.execute("INSERT INTO schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,))
-        
-        conn.commit()
-        conn.close()
+        conn = self._connect()
+        try:
+            # Fast path: an already initialized database only costs one PRAGMA read
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= self.SCHEMA_VERSION:
+                return
+            
+            conn.executescript(self._SQL_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {int(self.SCHEMA_VERSION)}")
+            conn.commit()
+        finally:
+            conn.close()
     
     def save_signal(self, signal: Signal) -> int:
         """
@@ -86,18 +109,15 @@ class SignalStorage:
         Returns:
             ID of the saved signal
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            INSERT INTO signals (timestamp, source, signal_type, data, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(self._SQL_INSERT, (
             signal.timestamp,
             signal.source,
             signal.signal_type,
-            json.dumps(signal.data),
-            json.dumps(signal.metadata) if signal.metadata else None
+            _dumps(signal.data),
+            _dumps(signal.metadata) if signal.metadata else None
         ))
         
         signal_id = cursor.lastrowid
@@ -116,20 +136,17 @@ class SignalStorage:
         Returns:
             List of signal IDs
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         ids = []
         for signal in signals:
-            cursor.execute("""
-                INSERT INTO signals (timestamp, source, signal_type, data, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(self._SQL_INSERT, (
                 signal.timestamp,
                 signal.source,
                 signal.signal_type,
-                json.dumps(signal.data),
-                json.dumps(signal.metadata) if signal.metadata else None
+                _dumps(signal.data),
+                _dumps(signal.metadata) if signal.metadata else None
             ))
             ids.append(cursor.lastrowid)
         
@@ -157,10 +174,11 @@ class SignalStorage:
         Returns:
             List of Signal objects
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
-        query = "SELECT timestamp, source, signal_type, data, metadata FROM signals WHERE 1=1"
+        query = self._SQL_SELECT
         params = []
         
         if source:
@@ -181,19 +199,20 @@ class SignalStorage:
             query += " LIMIT ?"
             params.append(limit)
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        
+        # Build signals while iterating the cursor rather than materializing
+        # every row with fetchall() first
         signals = []
-        for row in rows:
-            signals.append(Signal(
-                timestamp=row[0],
-                source=row[1],
-                signal_type=row[2],
-                data=json.loads(row[3]),
-                metadata=json.loads(row[4]) if row[4] else None
-            ))
+        try:
+            for row in cursor.execute(query, params):
+                signals.append(Signal(
+                    timestamp=row["timestamp"],
+                    source=row["source"],
+                    signal_type=row["signal_type"],
+                    data=_loads(row["data"]),
+                    metadata=_loads(row["metadata"]) if row["metadata"] else None
+                ))
+        finally:
+            conn.close()
         
         return signals
     
@@ -208,10 +227,10 @@ class SignalStorage:
         Returns:
             Number of signals
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        query = "SELECT COUNT(*) FROM signals WHERE 1=1"
+        query = self._SQL_COUNT
         params = []
         
         if source:
@@ -18,10 +18,15 @@ Exit codes:
 
 from __future__ import annotations
 
+import os
+import re
 import sys
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
 # Add scripts directory to path for imports
@@ -30,13 +35,47 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Import shared utilities
 from lil_os_utils import Colors, Finding, Timer, print_startup_banner, print_success_message, print_os_message
 
+# Secret patterns combined into one alternation so each file is scanned in a
+# single pass; the matching group name identifies the kind of secret. Matched
+# against decoded text, so lengths count characters and \s / IGNORECASE
+# cover Unicode.
+_SECRETS_RE = re.compile(
+    r'(?P<api_key>api[_-]?key\s*[:=]\s*["\']?[a-zA-Z0-9_\-]{32,}["\']?)'
+    r'|(?P<secret_key>secret[_-]?key\s*[:=]\s*["\']?[a-zA-Z0-9_\-]{32,}["\']?)'
+    r'|(?P<password>password\s*[:=]\s*["\']?.{12,}["\']?)'
+    r'|(?P<private_key>-----BEGIN.*PRIVATE KEY-----)',
+    re.IGNORECASE
+)
+_SECRET_LABELS = {
+    "api_key": "API key",
+    "secret_key": "Secret key",
+    "password": "Password",
+    "private_key": "Private key",
+}
+
+# Absolute path to git, resolved once instead of walking PATH on every call
+_GIT = shutil.which("git")
+
+_GOVERNANCE_FILES = frozenset({
+    "docs/MASTER_RULES.md",
+    "docs/GOVERNANCE.md",
+    "docs/RESET_TRIGGERS.md",
+    "docs/CONTEXT_BUDGET.md",
+    ".cursorrules",
+})
+_DECISION_LOG = "docs/DECISION_LOG.md"
+
+# Bytes sniffed from the start of a file to detect binary content
+_BINARY_SNIFF_BYTES = 4096
+
 def git_available() -> bool:
-    """Check if git is available."""
-    try:
-        subprocess.run(["git", "--version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """
+    Check if git is available.
+
+    Resolving the executable on PATH is enough: the git commands that follow
+    report their own failures, so no `git --version` process is spawned.
+    """
+    return _GIT is not None
 
 def get_staged_files() -> List[Path]:
     """Get list of staged files that are being committed."""
@@ -45,7 +84,7 @@ def get_staged_files() -> List[Path]:
     
     try:
         result = subprocess.run(
-            ["git", "diff", "--cached", "--name-only", "--diff-filter=ACM"],
+            [_GIT, "diff", "--cached", "--name-only", "--diff-filter=ACM"],
             capture_output=True,
             text=True,
             check=True
@@ -61,7 +100,7 @@ def get_modified_files() -> List[Path]:
     
     try:
         result = subprocess.run(
-            ["git", "diff", "--name-only", "--diff-filter=ACM"],
+            [_GIT, "diff", "--name-only", "--diff-filter=ACM"],
             capture_output=True,
             text=True,
             check=True
@@ -72,18 +111,11 @@ def get_modified_files() -> List[Path]:
 
 def is_governance_file(file_path: Path) -> bool:
     """Check if a file is a governance file."""
-    governance_files = [
-        "docs/MASTER_RULES.md",
-        "docs/GOVERNANCE.md",
-        "docs/RESET_TRIGGERS.md",
-        "docs/CONTEXT_BUDGET.md",
-        ".cursorrules",
-    ]
-    return str(file_path) in governance_files
+    return str(file_path) in _GOVERNANCE_FILES
 
 def is_decision_log(file_path: Path) -> bool:
     """Check if a file is the decision log."""
-    return str(file_path) == "docs/DECISION_LOG.md"
+    return str(file_path) == _DECISION_LOG
 
 def check_governance_file_changes(files: List[Path]) -> List[str]:
     """Check if governance files are being modified."""
@@ -124,6 +156,28 @@ def check_decision_log_entry(files: List[Path]) -> List[str]:
     
     return warnings
 
+def get_staged_numstat() -> Dict[str, Tuple[int, int]]:
+    """Get staged line counts per file as {path: (added, deleted)}."""
+    try:
+        result = subprocess.run(
+            [_GIT, "diff", "--cached", "--numstat"],
+            capture_output=True,
+            text=True
+        )
+    except Exception:
+        return {}
+    
+    if result.returncode != 0:
+        return {}
+    
+    stats: Dict[str, Tuple[int, int]] = {}
+    for line in result.stdout.splitlines():
+        parts = line.split("\t")
+        # Binary files report "-" instead of line counts
+        if len(parts) == 3 and parts[0].isdigit() and parts[1].isdigit():
+            stats[parts[2]] = (int(parts[0]), int(parts[1]))
+    return stats
+
 def check_large_changes(files: List[Path]) -> List[str]:
     """Check for unusually large changes that might indicate important decisions."""
     warnings = []
@@ -133,70 +187,66 @@ def check_large_changes(files: List[Path]) -> List[str]:
     
     large_threshold = 50  # lines changed
     
+    # One git call for the whole changeset instead of one per file
+    staged_stats = get_staged_numstat()
+    
     for file_path in files:
-        if not file_path.exists():
+        if not file_path.exists() or str(file_path) not in staged_stats:
             continue
         
-        try:
-            # Check staged changes
-            result = subprocess.run(
-                ["git", "diff", "--cached", "--numstat", str(file_path)],
-                capture_output=True,
-                text=True
+        added, deleted = staged_stats[str(file_path)]
+        total = added + deleted
+        
+        if total > large_threshold and is_governance_file(file_path):
+            warnings.append(
+                f"{Colors.BRIGHT_YELLOW}⚠️  Large change detected in {file_path}{Colors.RESET}\n"
+                f"   {total} lines changed ({added} added, {deleted} deleted)\n"
+                f"   {Colors.CYAN}This is a significant change. Make sure you've logged it in the decision log.{Colors.RESET}\n"
             )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split()
-                if len(parts) >= 2:
-                    try:
-                        added = int(parts[0])
-                        deleted = int(parts[1])
-                        total = added + deleted
-                        
-                        if total > large_threshold and is_governance_file(file_path):
-                            warnings.append(
-                                f"{Colors.BRIGHT_YELLOW}⚠️  Large change detected in {file_path}{Colors.RESET}\n"
-                                f"   {total} lines changed ({added} added, {deleted} deleted)\n"
-                                f"   {Colors.CYAN}This is a significant change. Make sure you've logged it in the decision log.{Colors.RESET}\n"
-                            )
-                    except ValueError:
-                        pass
-        except Exception:
-            pass
     
     return warnings
 
-def check_secrets_in_changes(files: List[Path]) -> List[str]:
-    """Quick check for obvious secrets in changed files."""
-    warnings = []
-    secret_patterns = [
-        (r'api[_-]?key\s*[:=]\s*["\']?[a-zA-Z0-9_\-]{32,}["\']?', 'API key'),
-        (r'secret[_-]?key\s*[:=]\s*["\']?[a-zA-Z0-9_\-]{32,}["\']?', 'Secret key'),
-        (r'password\s*[:=]\s*["\']?.{12,}["\']?', 'Password'),
-        (r'-----BEGIN.*PRIVATE KEY-----', 'Private key'),
-    ]
+def find_secret_type(file_path: Path) -> Optional[str]:
+    """Return the label of the first secret found in a file, if any."""
+    with open(file_path, "rb") as f:
+        data = f.read()
+    # Skip binary files
+    if b"\0" in data[:_BINARY_SNIFF_BYTES]:
+        return None
+    match = _SECRETS_RE.search(data.decode("utf-8", errors="replace"))
     
-    import re
+    if match:
+        return _SECRET_LABELS[match.lastgroup]
+    return None
+
+def _scan_file_for_secrets(file_path: Path) -> List[str]:
+    """Return a secret warning for a single file, if it contains one."""
+    if not file_path.exists() or file_path.name == "SECURITY.md":
+        return []
     
-    for file_path in files:
-        if not file_path.exists() or file_path.name == "SECURITY.md":
-            continue
-        
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            
-            for pattern, secret_type in secret_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    warnings.append(
-                        f"{Colors.BRIGHT_RED}⚠️  SECURITY WARNING: Possible {secret_type} found in {file_path}{Colors.RESET}\n"
-                        f"   {Colors.YELLOW}Never commit secrets to version control!{Colors.RESET}\n"
-                        f"   {Colors.CYAN}Use environment variables or secret management tools instead.{Colors.RESET}\n"
-                    )
-                    break  # Only warn once per file
-        except Exception:
-            pass
+    try:
+        # Only warn once per file
+        secret_type = find_secret_type(file_path)
+    except Exception:
+        return []
     
-    return warnings
+    if not secret_type:
+        return []
+    return [
+        f"{Colors.BRIGHT_RED}⚠️  SECURITY WARNING: Possible {secret_type} found in {file_path}{Colors.RESET}\n"
+        f"   {Colors.YELLOW}Never commit secrets to version control!{Colors.RESET}\n"
+        f"   {Colors.CYAN}Use environment variables or secret management tools instead.{Colors.RESET}\n"
+    ]
+
+def check_secrets_in_changes(files: List[Path]) -> List[str]:
+    """Quick check for obvious secrets in changed files."""
+    if not files:
+        return []
+    
+    # Files are scanned concurrently; map() keeps warnings in input order
+    max_workers = min(8, (os.cpu_count() or 1) * 2, len(files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(chain.from_iterable(executor.map(_scan_file_for_secrets, files)))
 
 def print_warnings(warnings: List[str], is_pre_commit: bool = False):
     """Print all warnings in a user-friendly format."""
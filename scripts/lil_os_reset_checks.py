@@ -10,14 +10,25 @@ Dependencies: Python 3.10+ (standard library only)
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 import json
+import bisect
+import hashlib
+import shutil
+import functools
+import threading
 import subprocess
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import accumulate, chain
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, Iterable, Iterator, List, Tuple, Optional, TypeVar
+
+T = TypeVar("T")
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -28,9 +39,9 @@ sys.path.insert(0, str(lil_os_dir.parent))
 
 # Import shared utilities
 from lil_os_utils import (
-    Finding, load_simple_yaml, read_text, normalize_yaml_list, Colors,
+    Finding, load_simple_yaml, normalize_yaml_list, iter_file_entries, Colors,
     Timer, print_startup_banner, print_success_message, generate_report, save_report,
-    print_os_error, format_os_finding
+    print_os_error, format_os_finding, print_os_message
 )
 
 # Import event system (optional - won't break if not available)
@@ -40,6 +51,58 @@ try:
 except ImportError:
     EVENTS_AVAILABLE = False
 
+# dateutil is optional; ISO-8601 dates are parsed with the standard library
+try:
+    from dateutil import parser as date_parser
+    DATEUTIL_AVAILABLE = True
+except ImportError:
+    DATEUTIL_AVAILABLE = False
+
+# ----------------------------
+# Precompiled patterns
+# ----------------------------
+_RE_BULLET = re.compile(r"^\s*[-*]\s+\S+", re.MULTILINE)
+_RE_MUST = re.compile(r"\b(MUST NOT|MUST|SHALL NOT|SHALL)\b")
+_RE_HEADER_SPLIT = re.compile(r"(?m)^\s*#{2,6}\s+")
+_RE_ENTRY_SEP = re.compile(r"\n-{3,}\n")
+_RE_DATE_FIELD = re.compile(r"Date:\s*([^\n]+)", re.IGNORECASE)
+_RE_AUTOMATION_BUDGET = re.compile(r'### Automation Budget\s*\n(.*?)(?=\n###|\n##|$)', re.DOTALL | re.IGNORECASE)
+_RE_FORBIDDEN_BLOCK = re.compile(r'Forbidden by default:\s*\n((?:- .+\n?)+)', re.IGNORECASE)
+# Rule ID pattern from lil_os.rule_id.yaml
+# (non-capturing: only the whole ID is used, and the literal "[LIL-" prefix
+# lets the engine skip ahead to candidate positions)
+_RE_RULE_ID = re.compile(r'\[LIL-(?:MR|GOV|CB|RT|WF|QL|SEC|DATA|API|PERF|CR)-(?:BOUNDARY|AUTH|PROCESS|SAFETY|SCOPE|FORMAT|BUDGET|LOG|RESET)-\d{4}\]')
+_RE_ANY_RULE_ID = re.compile(r'\[LIL-[^\]]+\]')
+_RE_CONTRADICTS = re.compile(r'contradicts\s+(\[LIL-[^\]]+\])', re.IGNORECASE)
+# CONTEXT_BUDGET.md "Forbidden by default" phrases mapped to YAML config
+# keywords; the first phrase found in a bullet wins
+_FORBIDDEN_DOMAIN_MAP: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("value judgment", ("value judgment", "moral", "ethics", "ethical")),
+    ("moral", ("moral", "ethics", "ethical")),
+    ("tradeoff", ("moral", "ethics", "ethical")),
+    ("irreversible harm", ("irreversible harm", "permanent damage")),
+    ("audit trail", ("without audit", "no audit trail", "no logging")),
+    ("without audit", ("without audit", "no audit trail", "no logging")),
+    ("no audit", ("without audit", "no audit trail", "no logging")),
+)
+# Runs of lowercase hex long enough to contain an abbreviated commit hash
+_RE_HEX_RUN = re.compile(r"[0-9a-f]{8,}")
+
+# Bytes hashed per read when hashlib.file_digest is unavailable (Python < 3.11)
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Secret matches kept for the report; further matches are only counted
+MAX_REPORTED_SECRETS = 50
+
+# Files larger than this are not scanned for secrets (reported as skipped)
+MAX_SECRET_SCAN_BYTES = 1024 * 1024
+# Characters sniffed from the start of a file to detect binary content
+_BINARY_SNIFF_CHARS = 4096
+# Files that contain pattern examples (like SECURITY.md), by name or path
+_SECRET_SCAN_EXCLUDED = frozenset({"SECURITY.md", "docs/SECURITY.md"})
+
+_RE_NEWLINE = re.compile(r"\n")
+
 # ----------------------------
 # Reporting
 # ----------------------------
@@ -56,7 +119,6 @@ def print_findings(findings: List[Finding]) -> int:
             print()
 
     # Summary with OS-like formatting
-    from lil_os_utils import print_os_message
     if hard:
         print_os_message(f"Summary: {len(hard)} hard fail(s), {len(warn)} warning(s), {len(findings)} total finding(s).", "ERROR")
     elif warn:
@@ -66,42 +128,350 @@ def print_findings(findings: List[Finding]) -> int:
     
     return 1 if hard else 0
 
-def git_available() -> bool:
+# Absolute path to git, resolved once; None when git is not installed
+_GIT = shutil.which("git")
+
+# Days of history searched for governance file modifications
+GOVERNANCE_WINDOW_DAYS = 30
+
+# Field separators for the batched `git log -z --numstat` output
+# (output is read as bytes; only the fields that are used get decoded)
+_GIT_LOG_FORMAT = "%x1e%H%x1f%ct%x1f%ai%x1f%s"
+_GIT_RECORD_START = b"\x1e"
+_GIT_FIELD_SEP = "\x1f"
+# Bytes read from git's stdout per chunk when streaming the log
+_GIT_READ_CHUNK_SIZE = 64 * 1024
+
+def iter_nul_records(stream) -> Iterator[bytes]:
+    """
+    Yield the NUL-delimited records of a binary stream as they arrive.
+
+    Reads fixed-size chunks, so a large `git log -z` is never buffered whole.
+    """
+    pending = b""
+    for chunk in iter(lambda: stream.read(_GIT_READ_CHUNK_SIZE), b""):
+        *records, pending = (pending + chunk).split(b"\0")
+        yield from records
+    if pending:
+        yield pending
+
+def find_repo_root(start: Path) -> Optional[Path]:
+    """Return the nearest directory at or above start that contains .git."""
+    start = start.resolve()
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+@dataclass
+class GitContext:
+    """
+    Commit history shared by the git-based checks.
+
+    Built once per run from a single `git log --numstat` covering the widest
+    window any check needs; checks then slice it by date instead of spawning
+    their own git processes. ``available`` is False when git is missing or
+    the log could not be read (e.g. outside a repository).
+    """
+    available: bool
+    window_days: int = 0
+    # Newest first: {"hash", "timestamp", "date", "message", "added", "deleted"}
+    commits: List[dict] = field(default_factory=list)
+    # Repo-root-relative posix path -> commits touching it, newest first
+    per_file_commits: dict = field(default_factory=dict)
+    root: Optional[Path] = None
+
+    @staticmethod
+    def start(max_days: int) -> Optional[subprocess.Popen]:
+        """
+        Launch the shared `git log` without waiting for it.
+
+        Lets callers overlap the git process with other work; pass the
+        returned process to collect(). Returns None if git cannot be run.
+        """
+        if _GIT is None:
+            return None
+        since = (datetime.now() - timedelta(days=max_days)).strftime("%Y-%m-%d")
+        cmd = [_GIT, "log", "-z", f"--since={since}", "--numstat", f"--format={_GIT_LOG_FORMAT}"]
+        try:
+            return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+
+    @classmethod
+    def build(cls, max_days: int) -> "GitContext":
+        return cls.collect(cls.start(max_days), max_days)
+
+    @classmethod
+    def collect(cls, proc: Optional[subprocess.Popen], max_days: int) -> "GitContext":
+        """Parse a log started by start() as git streams it."""
+        if proc is None:
+            return cls(available=False)
+        with proc:
+            ctx = cls._parse_log(iter_nul_records(proc.stdout), max_days)
+        if proc.returncode != 0:
+            return cls(available=False)
+        return ctx
+
+    @classmethod
+    def _parse_log(cls, records: Iterable[bytes], max_days: int) -> "GitContext":
+        ctx = cls(available=True, window_days=max_days, root=find_repo_root(Path.cwd()) or Path.cwd().resolve())
+        current = None
+        rename_paths_pending = 0
+        per_file_commits = ctx.per_file_commits
+        for record in records:
+            if rename_paths_pending:
+                # Renames list the old and new path as two extra records; the
+                # commit touched both, as a path-limited `git log` reports
+                rename_paths_pending -= 1
+                if current is not None:
+                    per_file_commits.setdefault(record.decode("utf-8", errors="replace"), []).append(current)
+                continue
+            record = record.lstrip(b"\n")
+            if record.startswith(_GIT_RECORD_START):
+                parts = record[1:].decode("utf-8", errors="replace").split(_GIT_FIELD_SEP, 3)
+                if len(parts) < 4:
+                    current = None
+                    continue
+                current = {
+                    "hash": parts[0],
+                    "timestamp": int(parts[1]) if parts[1].isdigit() else 0,
+                    "date": parts[2],
+                    "message": parts[3],
+                    "added": 0,
+                    "deleted": 0,
+                }
+                ctx.commits.append(current)
+                continue
+            parts = record.split(b"\t", 2)
+            if current is None or len(parts) < 3:
+                continue
+            added, deleted, path = parts
+            # Binary files report "-" instead of line counts
+            if added.isdigit() and deleted.isdigit():
+                current["added"] += int(added)
+                current["deleted"] += int(deleted)
+            if path:
+                per_file_commits.setdefault(path.decode("utf-8", errors="replace"), []).append(current)
+            else:
+                rename_paths_pending = 2
+        return ctx
+
+    def _cutoff(self, days: int) -> float:
+        """Earliest committer timestamp within the last `days` days (0 for the full window)."""
+        if days >= self.window_days:
+            return 0
+        return (datetime.now() - timedelta(days=days)).timestamp()
+
+    def changed_lines_since(self, days: int) -> Tuple[int, int]:
+        cutoff = self._cutoff(days)
+        added = deleted = 0
+        for commit in self.commits:
+            if commit["timestamp"] >= cutoff:
+                added += commit["added"]
+                deleted += commit["deleted"]
+        return (added, deleted)
+
+    def file_key(self, path: Path) -> str:
+        """Repo-root-relative posix path, as git reports it."""
+        return Path(os.path.relpath(os.path.abspath(path), self.root)).as_posix()
+
+    def commits_for(self, path: Path, days: int) -> List[dict]:
+        cutoff = self._cutoff(days)
+        return [c for c in self.per_file_commits.get(self.file_key(path), ()) if c["timestamp"] >= cutoff]
+
+# (path, reflog signature) -> parsed `git log --follow` commits
+_GIT_HISTORY_CACHE: dict = {}
+
+def _reflog_signature() -> Optional[Tuple[int, int]]:
+    """Cheap stat-based signature of .git/logs/HEAD, which changes on every commit or checkout."""
     try:
-        subprocess.run(["git", "--version"], check=True, capture_output=True, text=True)
-        return True
-    except Exception:
-        return False
-
-def git_changed_lines_since(days: int) -> Tuple[int, int]:
-    if not git_available():
-        return (0, 0)
-    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-    cmd = ["git", "log", f"--since={since}", "--numstat", "--pretty=format:"]
-    res = subprocess.run(cmd, capture_output=True, text=True)
-    if res.returncode != 0:
-        return (0, 0)
-
-    added = deleted = 0
-    for ln in res.stdout.splitlines():
-        if not ln.strip():
-            continue
-        parts = ln.split("\t")
-        if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
-            added += int(parts[0])
-            deleted += int(parts[1])
-    return (added, deleted)
+        st = Path(".git/logs/HEAD").stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def git_file_history(path: Path) -> List[dict]:
+    """
+    Return the commits touching a file (following renames), newest first.
+
+    Results are memoized per process while HEAD's reflog is unchanged, so
+    repeated in-process runs (e.g. from the lil-os shell) skip the subprocess.
+    Raises subprocess.CalledProcessError if git fails.
+    """
+    signature = _reflog_signature()
+    key = (str(path), signature)
+    if signature is not None and key in _GIT_HISTORY_CACHE:
+        return _GIT_HISTORY_CACHE[key]
+
+    cmd = [_GIT, "log", "--follow", "--format=%H|%ai|%s", "--", str(path)]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+
+    commits = []
+    for line in result.stdout.strip().splitlines():
+        parts = line.decode("utf-8", errors="replace").split("|", 2)
+        if len(parts) >= 3:
+            commits.append({
+                "hash": parts[0],
+                "date": parts[1],
+                "message": parts[2]
+            })
+
+    if signature is not None:
+        _GIT_HISTORY_CACHE[key] = commits
+    return commits
+
+@functools.lru_cache(maxsize=32)
+def marker_regex(markers: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile case-insensitive literal markers into one alternation (None if there are no markers)."""
+    if not markers:
+        return None
+    return re.compile("|".join(re.escape(m) for m in markers), re.IGNORECASE)
+
+def newline_offsets(text: str) -> List[int]:
+    """
+    Return the sorted offsets of every newline in text.
+
+    The 1-based line number of offset pos is bisect_left(offsets, pos) + 1.
+    """
+    return [m.start() for m in _RE_NEWLINE.finditer(text)]
+
+def matching_indices(pattern: re.Pattern, texts: List[str]) -> List[int]:
+    """
+    Return the indices of texts containing a match for pattern.
+
+    The texts are searched as one NUL-joined string, so a list of many short
+    texts costs one regex call per matching text rather than one per text.
+    A pattern that can match a NUL may also report a text whose match runs
+    into the next one, so callers should re-check candidates they act on.
+    """
+    if not texts:
+        return []
+    joined = "\0".join(texts)
+    # Offset at which each text starts within the joined string
+    starts = list(accumulate((len(t) + 1 for t in texts[:-1]), initial=0))
+    indices: List[int] = []
+    pos = 0
+    while True:
+        match = pattern.search(joined, pos)
+        if match is None:
+            return indices
+        idx = bisect.bisect_right(starts, match.start()) - 1
+        indices.append(idx)
+        if idx + 1 >= len(texts):
+            return indices
+        # Resume at the next text; one match per text is enough
+        pos = starts[idx + 1]
+
+def substring_flags(texts: List[str], needle_lists: List[List[str]]) -> List[List[bool]]:
+    """
+    For each list of needles, flag the texts containing any of them.
+
+    Like matching_indices, the texts are searched as one NUL-joined string
+    and hits are attributed to a text by bisecting its start offset, so the
+    cost is one str.find per matching text and needle rather than one
+    substring test per text and needle.
+    """
+    if not texts or not any(needle_lists):
+        return [[False] * len(texts) for _ in needle_lists]
+    joined = "\0".join(texts)
+    starts = list(accumulate((len(t) + 1 for t in texts[:-1]), initial=0))
+    last = len(texts) - 1
+    results: List[List[bool]] = []
+    for needles in needle_lists:
+        flags = [False] * len(texts)
+        for needle in needles:
+            pos = joined.find(needle)
+            while pos != -1:
+                idx = bisect.bisect_right(starts, pos) - 1
+                flags[idx] = True
+                if idx >= last:
+                    break
+                # Resume at the next text; one hit per text is enough
+                pos = joined.find(needle, starts[idx + 1])
+        results.append(flags)
+    return results
+
+def walk_files(root: Path, suffixes: Optional[Tuple[str, ...]] = None) -> List[Path]:
+    """List files under root recursively, optionally filtered by suffix."""
+    return [
+        Path(entry.path) for entry in iter_file_entries(root)
+        if suffixes is None or entry.name.endswith(suffixes)
+    ]
+
+def count_files(root: Path) -> int:
+    """Count files under root recursively without building Path objects."""
+    return sum(1 for _ in iter_file_entries(root))
+
+@functools.lru_cache(maxsize=1024)
+def parse_date(value: str) -> datetime:
+    """
+    Parse a date string, trying ISO-8601 via datetime.fromisoformat first.
+
+    Falls back to dateutil for other formats when it is installed; otherwise
+    raises ValueError. Cached because the governance and integrity checks
+    compare the same entry and commit dates many times over.
+    """
+    value = value.strip()
+    try:
+        # fromisoformat only accepts a trailing "Z" from Python 3.11
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        if DATEUTIL_AVAILABLE:
+            return date_parser.parse(value)
+        raise
+
+# Thread name prefix of main()'s check pool; map_files runs serially on those threads
+_CHECK_THREAD_PREFIX = "lil-os-check"
+
+def map_files(func: Callable[[Path], T], paths: List[Path]) -> List[T]:
+    """Apply func to each path on a thread pool, overlapping file I/O; results keep input order."""
+    # Checks already run concurrently in main(); a nested pool per check only adds churn
+    if len(paths) < 2 or threading.current_thread().name.startswith(_CHECK_THREAD_PREFIX):
+        return [func(p) for p in paths]
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, paths))
 
 def count_rules_in_text(text: str) -> int:
-    bullets = len(re.findall(r"^\s*[-*]\s+\S+", text, flags=re.MULTILINE))
-    musts = len(re.findall(r"\b(MUST NOT|MUST|SHALL NOT|SHALL)\b", text))
+    # Two C-level findall passes beat one combined alternation: a bullet whose
+    # first word is itself MUST/SHALL counts twice, so a single pass would need
+    # a Python-level re-check of every bullet token
+    bullets = len(_RE_BULLET.findall(text))
+    musts = len(_RE_MUST.findall(text))
     return bullets + musts
 
-def parse_decision_log_entries(text: str) -> List[str]:
+def count_rules_in_file(path: Path) -> int:
+    return count_rules_in_text(read_text_cached(path))
+
+@dataclass(frozen=True)
+class DecisionEntry:
+    """A decision log entry with derived forms shared by all checks."""
+    text: str
+    text_lower: str
+    # Value of the entry's "Date:" field, stripped; None if it has none
+    date_str: Optional[str]
+
+    @classmethod
+    def from_text(cls, text: str) -> "DecisionEntry":
+        date_match = _RE_DATE_FIELD.search(text)
+        return cls(text=text, text_lower=text.lower(), date_str=date_match.group(1).strip() if date_match else None)
+
+    @functools.cached_property
+    def date(self) -> Optional[datetime]:
+        """The parsed "Date:" field, or None if it is missing or unparseable."""
+        if self.date_str is None:
+            return None
+        try:
+            return parse_date(self.date_str)
+        except (ValueError, OverflowError):
+            return None
+
+def parse_decision_log_entries(text: str) -> List[DecisionEntry]:
     # Skip metadata sections - only parse entries after "Entries" section or entries with actual field values
     skip_sections = {"purpose", "what belongs here", "required fields", "template", "entries"}
     
-    parts = re.split(r"(?m)^\s*#{2,6}\s+", text)
+    parts = _RE_HEADER_SPLIT.split(text)
     if len(parts) > 1:
         entries = []
         in_entries_section = False
@@ -120,36 +490,86 @@ def parse_decision_log_entries(text: str) -> List[str]:
             # Only include entries that have actual field values (not just headers)
             # An entry should have at least "Date:" and "Decision:" fields
             if "Date:" in p and "Decision:" in p:
-                entries.append(p)
+                entries.append(DecisionEntry.from_text(p))
             elif in_entries_section:
                 # If we're in entries section, include it even if format is slightly off
-                entries.append(p)
+                entries.append(DecisionEntry.from_text(p))
         return entries
-    return [p.strip() for p in re.split(r"\n-{3,}\n", text) if p.strip() and "Date:" in p and "Decision:" in p]
+    return [DecisionEntry.from_text(p.strip()) for p in _RE_ENTRY_SEP.split(text) if p.strip() and "Date:" in p and "Decision:" in p]
 
-def entry_missing_fields(entry: str, required_fields: List[str]) -> List[str]:
-    missing = []
-    for field in required_fields:
-        if field.lower().startswith("review date"):
-            # review date optional in v1 checks; treat absence as warning only
-            continue
-        if field.lower() not in entry.lower():
-            missing.append(field)
-    return missing
+@functools.lru_cache(maxsize=256)
+def _read_text_file(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a text file; the stat key invalidates the cache when the file changes."""
+    return Path(path_str).read_text(encoding="utf-8", errors="replace")
+
+def read_text_cached(path: Path) -> str:
+    """Like read_text, but files read by several checks are only read once while unchanged."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return ""
+    return _read_text_file(str(path), st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=16)
+def _parse_decision_log_file(path_str: str, mtime_ns: int, size: int) -> Tuple[DecisionEntry, ...]:
+    """Parse a decision log file; the stat key invalidates the cache when the file changes."""
+    return tuple(parse_decision_log_entries(read_text_cached(Path(path_str))))
+
+def parse_decision_log_entries_cached(path: Path) -> List[DecisionEntry]:
+    """Parse a decision log file, reusing the previous parse while its mtime and size are unchanged."""
+    try:
+        st = path.stat()
+    except OSError:
+        return []
+    return list(_parse_decision_log_file(str(path), st.st_mtime_ns, st.st_size))
+
+def lowered_required_fields(required_fields: List[str]) -> List[Tuple[str, str]]:
+    """Pair each required field with its lowercase form, once per check rather than per entry."""
+    # review date optional in v1 checks; treat absence as warning only
+    return [(f, f.lower()) for f in required_fields if not f.lower().startswith("review date")]
+
+def entry_missing_fields(entry: DecisionEntry, required_lower: List[Tuple[str, str]]) -> List[str]:
+    """Return the required fields absent from entry, given lowered_required_fields() pairs."""
+    return [f for f, f_lower in required_lower if f_lower not in entry.text_lower]
+
+def scan_decision_log_entries(
+    entries: List[DecisionEntry],
+    required_fields: List[str],
+    override_markers: List[str],
+    metric_markers: List[str],
+    rolling_entries: Optional[int] = None,
+) -> Tuple[List[List[str]], List[bool], List[bool]]:
+    """
+    Evaluate required fields, override markers and metric markers in one pass over entries.
+
+    Returns parallel lists of missing fields (only for the first rolling_entries
+    entries), override flags and metric flags.
+    """
+    # Plain substring searches of the pre-lowercased entry text beat a
+    # case-insensitive regex alternation for marker lists of this size
+    override_lower = [m.lower() for m in override_markers]
+    metric_lower = [m.lower() for m in metric_markers]
+    required_lower = lowered_required_fields(required_fields)
+    limit = len(entries) if rolling_entries is None else min(rolling_entries, len(entries))
+    missing_fields = [entry_missing_fields(entry, required_lower) for entry in entries[:limit]]
+    override_flags, metric_flags = substring_flags(
+        [entry.text_lower for entry in entries], [override_lower, metric_lower])
+    return missing_fields, override_flags, metric_flags
 
 # ----------------------------
 # Checks
 # ----------------------------
 def check_justification_decay(decision_log: Path, required_fields: List[str], incomplete_threshold: int, rolling_entries: int) -> List[Finding]:
-    findings: List[Finding] = []
-    text = read_text(decision_log)
-    if not text:
-        return [Finding("WARN", "DECISION_LOG_MISSING", "Decision log not found or empty.", {"path": str(decision_log)})]
+    decay_findings, _, _ = run_decision_log_checks(
+        decision_log, required_fields, incomplete_threshold, rolling_entries,
+        override_markers=[], per_window_threshold=0, metric_markers=[], consecutive_threshold=0,
+    )
+    return decay_findings
 
-    entries = parse_decision_log_entries(text)[:rolling_entries]
+def justification_decay_findings(missing_fields: List[List[str]], incomplete_threshold: int) -> List[Finding]:
+    findings: List[Finding] = []
     incomplete = []
-    for idx, entry in enumerate(entries, start=1):
-        missing = entry_missing_fields(entry, required_fields)
+    for idx, missing in enumerate(missing_fields, start=1):
         if missing:
             incomplete.append({"entry_index": idx, "missing": missing})
 
@@ -158,24 +578,27 @@ def check_justification_decay(decision_log: Path, required_fields: List[str], in
             "HARD_FAIL",
             "DRIFT_JUSTIFICATION_DECAY",
             f"{len(incomplete)} decision log entry(ies) missing required fields (threshold {incomplete_threshold}).",
-            {"incomplete": incomplete[:20], "checked_entries": len(entries)}
+            {"incomplete": incomplete[:20], "checked_entries": len(missing_fields)}
         ))
     elif incomplete:
         findings.append(Finding(
             "WARN",
             "DRIFT_JUSTIFICATION_DECAY_WARN",
             f"{len(incomplete)} decision log entry(ies) missing required fields.",
-            {"incomplete": incomplete[:20], "checked_entries": len(entries)}
+            {"incomplete": incomplete[:20], "checked_entries": len(missing_fields)}
         ))
     return findings
 
-def check_context_budget_overflow(rule_files: List[Path], agents_dir: Path, memory_dir: Path, max_rules: int, max_agents: int, max_memory: int) -> List[Finding]:
+def check_context_budget_overflow(rule_files: List[Path], agents_dir: Path, memory_dir: Path, max_rules: int, max_agents: int, max_memory: int,
+                                  memory_files: Optional[List[Path]] = None) -> List[Finding]:
+    """memory_files, when given, is a listing of memory_dir already walked by the caller."""
     findings: List[Finding] = []
-    combined = "\n\n".join([read_text(p) for p in rule_files if p.exists()])
-    rule_count = count_rules_in_text(combined)
+    # Count per file rather than over one concatenated copy of every rule file;
+    # missing files read as empty and count zero
+    rule_count = sum(map_files(count_rules_in_file, rule_files))
 
-    agent_count = len([p for p in agents_dir.rglob("*") if p.is_file()]) if agents_dir.exists() else 0
-    mem_count = len([p for p in memory_dir.rglob("*") if p.is_file()]) if memory_dir.exists() else 0
+    agent_count = count_files(agents_dir)
+    mem_count = len(memory_files) if memory_files is not None else count_files(memory_dir)
 
     if rule_count > max_rules:
         findings.append(Finding("HARD_FAIL", "LOAD_CONTEXT_BUDGET_RULES", f"Rule budget exceeded: {rule_count} > {max_rules}.",
@@ -192,15 +615,35 @@ def check_context_budget_overflow(rule_files: List[Path], agents_dir: Path, memo
                                 {"rule_count": rule_count, "agent_files": agent_count, "memory_files": mem_count}))
     return findings
 
-def check_silent_memory_growth(memory_dir: Path, required_meta: List[str]) -> List[Finding]:
+def check_silent_memory_growth(memory_dir: Path, required_meta: List[str], memory_files: Optional[List[Path]] = None) -> List[Finding]:
+    """memory_files, when given, is a listing of memory_dir already walked by the caller."""
     findings: List[Finding] = []
     if not memory_dir.exists():
         return [Finding("INFO", "MEMORY_DIR_MISSING", "Memory directory not present; skipping memory metadata checks.", {"path": str(memory_dir)})]
 
+    # Keys are lowercased once rather than once per file. ASCII keys are
+    # searched in the lowercased raw bytes, skipping a full UTF-8 decode
+    required_lower = [(k, k.lower()) for k in required_meta]
+    ascii_keys = all(k.isascii() for k in required_meta)
+    if ascii_keys:
+        required_lower = [(k, k_lower.encode("ascii")) for k, k_lower in required_lower]
+
+    def missing_meta(p: Path) -> List[str]:
+        # Memory artifacts are read by this check only, so they skip the
+        # shared text cache instead of evicting files other checks reuse
+        try:
+            if ascii_keys:
+                content = p.read_bytes().lower()
+            else:
+                content = p.read_text(encoding="utf-8", errors="replace").lower()
+        except FileNotFoundError:
+            content = b"" if ascii_keys else ""
+        return [k for k, k_lower in required_lower if k_lower not in content]
+
     offenders = []
-    for p in [x for x in memory_dir.rglob("*") if x.is_file()]:
-        txt = read_text(p)
-        missing = [k for k in required_meta if k.lower() not in txt.lower()]
+    if memory_files is None:
+        memory_files = walk_files(memory_dir)
+    for p, missing in zip(memory_files, map_files(missing_meta, memory_files)):
         if missing:
             offenders.append({"path": str(p), "missing": missing})
 
@@ -211,8 +654,8 @@ def check_silent_memory_growth(memory_dir: Path, required_meta: List[str]) -> Li
         findings.append(Finding("INFO", "LOAD_MEMORY_METADATA_OK", "All memory artifacts include required metadata."))
     return findings
 
-def check_rule_accretion_velocity(days: int) -> List[Finding]:
-    added, deleted = git_changed_lines_since(days)
+def check_rule_accretion_velocity(days: int, git_ctx: GitContext) -> List[Finding]:
+    added, deleted = git_ctx.changed_lines_since(days)
     if added > deleted:
         return [Finding("WARN", "DRIFT_RULE_ACCRETION_WINDOW",
                         f"Net additions over last {days} days (proxy for rule accretion).",
@@ -220,14 +663,15 @@ def check_rule_accretion_velocity(days: int) -> List[Finding]:
     return [Finding("INFO", "DRIFT_RULE_ACCRETION_OK", f"No net additions over last {days} days.", {"added_lines": added, "deleted_lines": deleted})]
 
 def check_override_normalization(decision_log: Path, override_markers: List[str], per_window_threshold: int) -> List[Finding]:
-    text = read_text(decision_log)
-    if not text:
-        return []
-    entries = parse_decision_log_entries(text)
-    override_entries = []
-    for idx, entry in enumerate(entries, start=1):
-        if any(m.lower() in entry.lower() for m in override_markers):
-            override_entries.append(idx)
+    _, override_findings, _ = run_decision_log_checks(
+        decision_log, required_fields=[], incomplete_threshold=0, rolling_entries=0,
+        override_markers=override_markers, per_window_threshold=per_window_threshold,
+        metric_markers=[], consecutive_threshold=0,
+    )
+    return override_findings
+
+def override_normalization_findings(override_flags: List[bool], per_window_threshold: int) -> List[Finding]:
+    override_entries = [idx for idx, flagged in enumerate(override_flags, start=1) if flagged]
 
     if len(override_entries) >= per_window_threshold:
         return [Finding("HARD_FAIL", "LEGIT_OVERRIDE_NORMALIZATION",
@@ -239,35 +683,71 @@ def check_override_normalization(decision_log: Path, override_markers: List[str]
     return [Finding("INFO", "LEGIT_OVERRIDE_OK", "No override-tagged decisions detected.")]
 
 def check_metric_dominance(decision_log: Path, metric_markers: List[str], consecutive_threshold: int) -> List[Finding]:
-    text = read_text(decision_log)
-    if not text:
-        return []
-    entries = parse_decision_log_entries(text)
+    _, _, metric_findings = run_decision_log_checks(
+        decision_log, required_fields=[], incomplete_threshold=0, rolling_entries=0,
+        override_markers=[], per_window_threshold=0,
+        metric_markers=metric_markers, consecutive_threshold=consecutive_threshold,
+    )
+    return metric_findings
+
+def metric_dominance_findings(metric_flags: List[bool], consecutive_threshold: int) -> List[Finding]:
     streak = 0
-    streak_indices = []
-    for idx, entry in enumerate(entries, start=1):
-        if any(m.lower() in entry.lower() for m in metric_markers):
+    # Bounded to the threshold: a streak that reaches it returns immediately,
+    # so the window always holds the whole current streak
+    streak_indices = deque(maxlen=max(consecutive_threshold, 1))
+    for idx, flagged in enumerate(metric_flags, start=1):
+        if flagged:
             streak += 1
             streak_indices.append(idx)
             if streak >= consecutive_threshold:
                 return [Finding("HARD_FAIL", "LEGIT_METRIC_DOMINANCE",
                                 f"Metric dominance heuristic: {streak} consecutive decisions reference a metric (threshold {consecutive_threshold}).",
-                                {"streak_entry_indices": streak_indices[-consecutive_threshold:]})]
-        else:
+                                {"streak_entry_indices": list(streak_indices)})]
+        elif streak:
             streak = 0
-            streak_indices = []
+            streak_indices.clear()
     if streak > 0:
         return [Finding("WARN", "LEGIT_METRIC_DOMINANCE_WARN", enabling := f"Metric references detected in recent decisions (streak {streak}).",
-                        {"current_streak": streak, "streak_entry_indices": streak_indices})]
+                        {"current_streak": streak, "streak_entry_indices": list(streak_indices)})]
     return [Finding("INFO", "LEGIT_METRIC_OK", "No metric dominance streak detected.")]
 
-def check_decision_log_integrity(decision_log: Path, enabled: bool) -> List[Finding]:
+def run_decision_log_checks(
+    decision_log: Path,
+    required_fields: List[str],
+    incomplete_threshold: int,
+    rolling_entries: int,
+    override_markers: List[str],
+    per_window_threshold: int,
+    metric_markers: List[str],
+    consecutive_threshold: int,
+) -> Tuple[List[Finding], List[Finding], List[Finding]]:
+    """
+    Run the justification decay, override normalization and metric dominance checks.
+
+    The decision log entries are scanned once for all three. Returns their
+    findings separately so callers can keep the usual report order.
+    """
+    text = read_text_cached(decision_log)
+    if not text:
+        return [Finding("WARN", "DECISION_LOG_MISSING", "Decision log not found or empty.", {"path": str(decision_log)})], [], []
+
+    entries = parse_decision_log_entries_cached(decision_log)
+    missing_fields, override_flags, metric_flags = scan_decision_log_entries(
+        entries, required_fields, override_markers, metric_markers, rolling_entries
+    )
+    return (
+        justification_decay_findings(missing_fields, incomplete_threshold),
+        override_normalization_findings(override_flags, per_window_threshold),
+        metric_dominance_findings(metric_flags, consecutive_threshold),
+    )
+
+def check_decision_log_integrity(decision_log: Path, enabled: bool, git_ctx: GitContext) -> List[Finding]:
     """Check for retroactive modifications to decision log entries."""
     findings: List[Finding] = []
     if not enabled:
         return [Finding("INFO", "SEC_DECISION_LOG_INTEGRITY_DISABLED", "Decision log integrity check is disabled.")]
     
-    if not git_available():
+    if not git_ctx.available:
         return [Finding("WARN", "SEC_DECISION_LOG_INTEGRITY_NO_GIT", "Git not available; cannot check decision log integrity.")]
     
     if not decision_log.exists():
@@ -275,67 +755,51 @@ def check_decision_log_integrity(decision_log: Path, enabled: bool) -> List[Find
     
     try:
         # Get git log for decision log file
-        cmd = ["git", "log", "--follow", "--format=%H|%ai|%s", "--", str(decision_log)]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        commits = git_file_history(decision_log)
         
-        if not result.stdout.strip():
+        if not commits:
             return [Finding("INFO", "SEC_DECISION_LOG_INTEGRITY_OK", "Decision log has no git history (new file).")]
         
-        # Parse commits
-        commits = []
-        for line in result.stdout.strip().splitlines():
-            parts = line.split("|", 2)
-            if len(parts) >= 3:
-                commits.append({
-                    "hash": parts[0],
-                    "date": parts[1],
-                    "message": parts[2]
-                })
-        
         # Check for entries that were modified after initial creation
         # Get current entries
-        text = read_text(decision_log)
-        entries = parse_decision_log_entries(text)
+        entries = parse_decision_log_entries_cached(decision_log)
         
         suspicious_modifications = []
-        for idx, entry in enumerate(entries, start=1):
-            # Extract date from entry if present
-            date_match = re.search(r"Date:\s*([^\n]+)", entry, re.IGNORECASE)
-            if not date_match:
-                continue
-            
-            entry_date_str = date_match.group(1).strip()
-            
-            # Find commits that modified this entry
-            # For simplicity, check if there are multiple commits modifying the file
-            # A more sophisticated check would diff commits to see if specific entries changed
-            if len(commits) > 1:
-                # Check if the most recent commit modified an old entry
-                # This is a heuristic - if an entry has a date but was modified recently, flag it
+        # For simplicity, check if there are multiple commits modifying the file
+        # A more sophisticated check would diff commits to see if specific entries changed
+        latest = commits[0]
+        latest_commit_date = None
+        if len(commits) > 1:
+            try:
+                latest_commit_date = parse_date(latest["date"])
+            except Exception:
+                # If date parsing fails, no entry can be compared
+                pass
+        
+        if latest_commit_date is not None:
+            # Check if the most recent commit modified an old entry
+            # This is a heuristic - if an entry has a date but was modified recently, flag it
+            latest_msg_lower = latest["message"].lower()
+            for idx, entry in enumerate(entries, start=1):
+                # Entries without a (parseable) date are skipped
+                entry_date = entry.date
+                if entry_date is None:
+                    continue
                 try:
-                    from dateutil import parser as date_parser
-                    entry_date = date_parser.parse(entry_date_str)
-                    latest_commit_date = date_parser.parse(commits[0]["date"])
-                    
                     # If entry date is old but was modified recently (within last 7 days), flag it
                     days_diff = (latest_commit_date - entry_date).days
                     if days_diff > 7 and latest_commit_date > entry_date:
                         # Check if this commit message doesn't indicate a legitimate update
-                        commit_msg_lower = commits[0]["message"].lower()
-                        if not any(word in commit_msg_lower for word in ["update", "fix", "correct", "amend", "revise"]):
+                        if not any(word in latest_msg_lower for word in ["update", "fix", "correct", "amend", "revise"]):
                             suspicious_modifications.append({
                                 "entry_index": idx,
-                                "entry_date": entry_date_str,
-                                "last_modified": commits[0]["date"],
-                                "commit_hash": commits[0]["hash"][:8],
-                                "commit_message": commits[0]["message"]
+                                "entry_date": entry.date_str,
+                                "last_modified": latest["date"],
+                                "commit_hash": latest["hash"][:8],
+                                "commit_message": latest["message"]
                             })
-                except ImportError:
-                    # dateutil not available, use simple string comparison
-                    # Skip sophisticated date checking if dateutil is not installed
-                    pass
-                except Exception:
-                    # If date parsing fails, skip this entry
+                except TypeError:
+                    # Naive and timezone-aware dates cannot be compared; skip this entry
                     pass
         
         if suspicious_modifications:
@@ -355,51 +819,53 @@ def check_decision_log_integrity(decision_log: Path, enabled: bool) -> List[Find
     
     return findings
 
-def check_governance_file_changes(governance_files: List[Path], decision_log: Path, enabled: bool) -> List[Finding]:
+def check_governance_file_changes(governance_files: List[Path], decision_log: Path, enabled: bool, git_ctx: GitContext) -> List[Finding]:
     """Check if governance files were modified without corresponding decision log entries."""
     findings: List[Finding] = []
     if not enabled:
         return [Finding("INFO", "SEC_GOVERNANCE_FILE_CHECKS_DISABLED", "Governance file change detection is disabled.")]
     
-    if not git_available():
+    if not git_ctx.available:
         return [Finding("WARN", "SEC_GOVERNANCE_FILE_CHECKS_NO_GIT", "Git not available; cannot check governance file changes.")]
     
     try:
-        # Get recent commits (last 30 days) that modified governance files
-        since = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+        # Recent commits (last 30 days) that modified governance files, taken
+        # from the shared git log and grouped per file
+        existing_files = [f for f in governance_files if f.exists()]
         modified_files = []
-        
-        for gov_file in governance_files:
-            if not gov_file.exists():
-                continue
-            
-            cmd = ["git", "log", f"--since={since}", "--format=%H|%ai|%s", "--", str(gov_file)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0 and result.stdout.strip():
-                for line in result.stdout.strip().splitlines():
-                    parts = line.split("|", 2)
-                    if len(parts) >= 3:
-                        modified_files.append({
-                            "file": str(gov_file),
-                            "commit_hash": parts[0],
-                            "date": parts[1],
-                            "message": parts[2]
-                        })
+        for f in existing_files:
+            for commit in git_ctx.commits_for(f, GOVERNANCE_WINDOW_DAYS):
+                modified_files.append({
+                    "file": str(f),
+                    "commit_hash": commit["hash"],
+                    "date": commit["date"],
+                    "message": commit["message"]
+                })
         
         if not modified_files:
             return [Finding("INFO", "SEC_GOVERNANCE_FILE_CHECKS_OK", "No recent governance file modifications detected.")]
         
         # Check if decision log has entries that reference these changes
-        decision_log_text = read_text(decision_log) if decision_log.exists() else ""
-        entries = parse_decision_log_entries(decision_log_text)
+        entries = parse_decision_log_entries_cached(decision_log)
         
         # Extract file names from governance files
-        gov_file_names = [f.name for f in governance_files if f.exists()]
+        gov_file_names = [f.name.lower() for f in existing_files]
+        
+        # Index entries once instead of rescanning them for every modification.
+        # Every modified file is itself a governance file, so entries naming any
+        # governance file are candidates for all modifications; the rest can only
+        # match through an abbreviated commit hash, indexed by each 8-char window.
+        gov_entry_indices = set()
+        hash_to_entries = defaultdict(set)
+        for idx, entry in enumerate(entries):
+            if any(gov_name in entry.text_lower for gov_name in gov_file_names):
+                gov_entry_indices.add(idx)
+            for run in _RE_HEX_RUN.findall(entry.text):
+                for start in range(len(run) - 7):
+                    hash_to_entries[run[start:start + 8]].add(idx)
         
         unlogged_changes = []
         for mod in modified_files:
-            file_name = Path(mod["file"]).name
             commit_hash_short = mod["commit_hash"][:8]
             
             # Skip initial commits - they don't need decision log entries
@@ -409,35 +875,28 @@ def check_governance_file_changes(governance_files: List[Path], decision_log: Pa
             
             # Check if any decision log entry mentions this file or commit
             entry_found = False
-            for entry in entries:
-                entry_lower = entry.lower()
-                if (file_name.lower() in entry_lower or 
-                    commit_hash_short in entry or
-                    any(gov_name.lower() in entry_lower for gov_name in gov_file_names)):
-                    # Check if entry date is close to commit date
-                    date_match = re.search(r"Date:\s*([^\n]+)", entry, re.IGNORECASE)
-                    if date_match:
-                        try:
-                            from dateutil import parser as date_parser
-                            entry_date = date_parser.parse(date_match.group(1).strip())
-                            commit_date = date_parser.parse(mod["date"])
-                            days_diff = abs((commit_date - entry_date).days)
-                            if days_diff <= 7:  # Allow 7 day window
-                                entry_found = True
-                                break
-                        except ImportError:
-                            # dateutil not available, use simple matching
-                            # If file name matches, assume entry found
-                            entry_found = True
-                            break
-                        except Exception:
-                            # If date parsing fails, assume entry found if file name matches
+            candidates = sorted(gov_entry_indices.union(hash_to_entries.get(commit_hash_short, ())))
+            for idx in candidates:
+                entry = entries[idx]
+                # Check if entry date is close to commit date
+                if entry.date_str is not None:
+                    try:
+                        entry_date = entry.date
+                        if entry_date is None:
+                            raise ValueError(f"Unparseable date: {entry.date_str}")
+                        commit_date = parse_date(mod["date"])
+                        days_diff = abs((commit_date - entry_date).days)
+                        if days_diff <= 7:  # Allow 7 day window
                             entry_found = True
                             break
-                    else:
-                        # If no date in entry, but file name matches, assume it's related
+                    except Exception:
+                        # If date parsing fails, assume entry found if file name matches
                         entry_found = True
                         break
+                else:
+                    # If no date in entry, but file name matches, assume it's related
+                    entry_found = True
+                    break
             
             if not entry_found:
                 unlogged_changes.append(mod)
@@ -471,7 +930,8 @@ def check_secret_detection(decision_log: Path, scan_paths: List[Path], secret_pa
     
     detected_secrets = []
     
-    # Compile regex patterns
+    # Compile each pattern once, reporting invalid ones; the compiled
+    # patterns are reused for every scanned file
     compiled_patterns = []
     for pattern in secret_patterns:
         try:
@@ -480,58 +940,103 @@ def check_secret_detection(decision_log: Path, scan_paths: List[Path], secret_pa
             findings.append(Finding("WARN", "SEC_SECRET_PATTERN_ERROR", f"Invalid secret pattern: {pattern}", {"error": str(e)}))
             continue
     
+    # Each pattern scans the text on its own: every compiled pattern keeps its
+    # literal-prefix fast path and its own group numbering, which a combined
+    # alternation loses
+    def iter_secret_matches(text: str):
+        for pattern_name, pattern_re in compiled_patterns:
+            for match in pattern_re.finditer(text):
+                yield pattern_name, match
+    
     # Scan files
     files_to_scan = []
+    seen_roots = set()
     for path in scan_paths:
+        # Walk each distinct root only once
+        resolved = path.resolve()
+        if resolved in seen_roots:
+            continue
+        seen_roots.add(resolved)
         if path.is_file():
             files_to_scan.append(path)
         elif path.is_dir():
             # Scan markdown files in directory
-            files_to_scan.extend([f for f in path.rglob("*.md") if f.is_file()])
+            files_to_scan.extend(walk_files(path, (".md",)))
     
     # Always scan decision log
     if decision_log.exists() and decision_log not in files_to_scan:
         files_to_scan.append(decision_log)
     
     # Exclude files that contain pattern examples (like SECURITY.md)
-    excluded_files = ["SECURITY.md", "docs/SECURITY.md"]
-    files_to_scan = [f for f in files_to_scan if f.name not in excluded_files and str(f) not in excluded_files]
+    files_to_scan = [f for f in files_to_scan if f.name not in _SECRET_SCAN_EXCLUDED and str(f) not in _SECRET_SCAN_EXCLUDED]
     
-    for file_path in files_to_scan:
-        if not file_path.exists():
-            continue
-        
+    def scan_file(file_path: Path) -> Tuple[List[dict], int, Optional[Finding]]:
+        file_secrets = []
+        match_count = 0
         try:
-            text = read_text(file_path)
+            size = file_path.stat().st_size
+            if size > MAX_SECRET_SCAN_BYTES:
+                return file_secrets, match_count, Finding(
+                    "INFO", "SEC_SECRET_SCAN_SKIPPED_LARGE",
+                    f"Skipped secret scan of {file_path}: file exceeds {MAX_SECRET_SCAN_BYTES} bytes.",
+                    {"file": str(file_path), "size": size})
+            text = read_text_cached(file_path)
+            # Binary files cannot meaningfully hold the text secrets we look for
+            if "\0" in text[:_BINARY_SNIFF_CHARS]:
+                return file_secrets, match_count, None
+            # Newline offsets, built on the first match so line numbers are a
+            # binary search rather than a count over the text before each match
+            offsets = None
             
-            for pattern_name, pattern_re in compiled_patterns:
-                matches = pattern_re.finditer(text)
-                for match in matches:
-                    # Extract context (50 chars before and after)
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    context = text[start:end].replace("\n", " ").strip()
-                    
-                    # Get line number
-                    line_num = text[:match.start()].count("\n") + 1
-                    
-                    detected_secrets.append({
-                        "file": str(file_path),
-                        "line": line_num,
-                        "pattern": pattern_name,
-                        "context": context[:200]  # Limit context length
-                    })
+            for pattern_name, match in iter_secret_matches(text):
+                match_count += 1
+                # Matches beyond the report limit are only counted
+                if len(file_secrets) >= MAX_REPORTED_SECRETS:
+                    continue
+                
+                # Extract context (50 chars before and after)
+                start = max(0, match.start() - 50)
+                end = min(len(text), match.end() + 50)
+                context = text[start:end].replace("\n", " ").strip()
+                
+                # Get line number
+                if offsets is None:
+                    offsets = newline_offsets(text)
+                line_num = bisect.bisect_left(offsets, match.start()) + 1
+                
+                file_secrets.append({
+                    "file": str(file_path),
+                    "line": line_num,
+                    "pattern": pattern_name,
+                    "context": context[:200]  # Limit context length
+                })
         except Exception as e:
-            findings.append(Finding("WARN", "SEC_SECRET_SCAN_ERROR", f"Error scanning {file_path}: {e}"))
+            return file_secrets, match_count, Finding("WARN", "SEC_SECRET_SCAN_ERROR", f"Error scanning {file_path}: {e}")
+        return file_secrets, match_count, None
     
-    if detected_secrets:
+    total_matches = 0
+    # A file can be listed twice (e.g. the decision log under a scanned
+    # directory), so files with matches are counted by path
+    files_with_secrets = set()
+    # scan_file reports scan errors and skipped files as a per-file finding
+    scan_results = map_files(scan_file, files_to_scan)
+    for file_path, (file_secrets, match_count, file_finding) in zip(files_to_scan, scan_results):
+        detected_secrets.extend(file_secrets[:MAX_REPORTED_SECRETS - len(detected_secrets)])
+        total_matches += match_count
+        if match_count:
+            files_with_secrets.add(str(file_path))
+        if file_finding:
+            findings.append(file_finding)
+    
+    if total_matches:
         findings.append(Finding(
             "HARD_FAIL",
             "SEC_SECRET_DETECTED",
-            f"Potential secrets detected in {len(set(s['file'] for s in detected_secrets))} file(s). Remove secrets immediately and rotate any exposed credentials.",
+            f"Potential secrets detected in {len(files_with_secrets)} file(s). Remove secrets immediately and rotate any exposed credentials.",
             {
-                "detected_secrets": detected_secrets[:50],  # Limit to first 50 matches
-                "total_matches": len(detected_secrets),
+                "detected_secrets": detected_secrets,  # Limited to the first MAX_REPORTED_SECRETS matches
+                "total_matches": total_matches,
+                "truncated": total_matches > len(detected_secrets),
                 "note": "Secrets should never be committed to version control. Use environment variables or secret management tools."
             }
         ))
@@ -540,6 +1045,16 @@ def check_secret_detection(decision_log: Path, scan_paths: List[Path], secret_pa
     
     return findings
 
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, streamed rather than read into memory whole."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
 def check_script_checksums(script_paths: List[Path], expected_checksums: dict, enabled: bool) -> List[Finding]:
     """Verify validation scripts haven't been modified by checking checksums."""
     findings: List[Finding] = []
@@ -549,26 +1064,21 @@ def check_script_checksums(script_paths: List[Path], expected_checksums: dict, e
     if not expected_checksums:
         return [Finding("WARN", "SEC_SCRIPT_CHECKSUM_NO_EXPECTED", "Checksum verification enabled but no expected checksums provided.")]
     
-    import hashlib
-    
-    for script_path in script_paths:
+    def verify_script(script_path: Path) -> Optional[Finding]:
         if not script_path.exists():
-            findings.append(Finding("WARN", "SEC_SCRIPT_CHECKSUM_MISSING", f"Script not found: {script_path}"))
-            continue
+            return Finding("WARN", "SEC_SCRIPT_CHECKSUM_MISSING", f"Script not found: {script_path}")
         
         script_name = script_path.name
         if script_name not in expected_checksums:
             # Not all scripts need checksums - that's okay
-            continue
+            return None
         
         try:
-            # Calculate SHA256 checksum
-            content = script_path.read_bytes()
-            actual_checksum = hashlib.sha256(content).hexdigest()
+            actual_checksum = file_sha256(script_path)
             expected_checksum = expected_checksums[script_name].lower().strip()
             
             if actual_checksum != expected_checksum:
-                findings.append(Finding(
+                return Finding(
                     "HARD_FAIL",
                     "SEC_SCRIPT_CHECKSUM_MISMATCH",
                     f"Script {script_name} checksum mismatch. Script may have been modified or tampered with.",
@@ -578,11 +1088,13 @@ def check_script_checksums(script_paths: List[Path], expected_checksums: dict, e
                         "actual": actual_checksum,
                         "note": "If this is an intentional modification, update the expected checksum in configuration."
                     }
-                ))
-            else:
-                findings.append(Finding("INFO", "SEC_SCRIPT_CHECKSUM_OK", f"Script {script_name} checksum verified."))
+                )
+            return Finding("INFO", "SEC_SCRIPT_CHECKSUM_OK", f"Script {script_name} checksum verified.")
         except Exception as e:
-            findings.append(Finding("WARN", "SEC_SCRIPT_CHECKSUM_ERROR", f"Error verifying checksum for {script_name}: {e}"))
+            return Finding("WARN", "SEC_SCRIPT_CHECKSUM_ERROR", f"Error verifying checksum for {script_name}: {e}")
+    
+    # Scripts are hashed concurrently; findings keep the configured order
+    findings.extend(f for f in map_files(verify_script, script_paths) if f is not None)
     
     return findings
 
@@ -599,9 +1111,14 @@ def check_automation_creep(
     context_budget: Path,
     automation_keywords: List[str],
     forbidden_domains: List[str],
-    enabled: bool
+    enabled: bool,
+    max_violations: Optional[int] = 20
 ) -> List[Finding]:
-    """Check if automation is expanding into human-judgment domains."""
+    """
+    Check if automation is expanding into human-judgment domains.
+
+    Scanning stops once max_violations entries are flagged (None scans the whole log).
+    """
     findings: List[Finding] = []
     if not enabled:
         return [Finding("INFO", "LOAD_AUTOMATION_CREEP_DISABLED", "Automation creep detection is disabled.")]
@@ -613,14 +1130,15 @@ def check_automation_creep(
     # Normalize forbidden_domains to ensure it's a list
     forbidden_domains = normalize_yaml_list(forbidden_domains)
     extracted_forbidden_domains = forbidden_domains.copy()  # Start with YAML config as fallback
-    if context_budget.exists():
-        context_budget_text = read_text(context_budget)
+    # A missing CONTEXT_BUDGET.md reads as empty and matches nothing
+    context_budget_text = read_text_cached(context_budget)
+    if context_budget_text:
         # Look for "Automation Budget" section
-        automation_budget_match = re.search(r'### Automation Budget\s*\n(.*?)(?=\n###|\n##|$)', context_budget_text, re.DOTALL | re.IGNORECASE)
+        automation_budget_match = _RE_AUTOMATION_BUDGET.search(context_budget_text)
         if automation_budget_match:
             automation_section = automation_budget_match.group(1)
             # Extract forbidden domains from bullet points under "Forbidden by default:"
-            forbidden_match = re.search(r'Forbidden by default:\s*\n((?:- .+\n?)+)', automation_section, re.IGNORECASE)
+            forbidden_match = _RE_FORBIDDEN_BLOCK.search(automation_section)
             if forbidden_match:
                 forbidden_lines = forbidden_match.group(1)
                 # Extract each bullet point and map to YAML config format
@@ -630,14 +1148,10 @@ def check_automation_creep(
                     if line.startswith('- '):
                         domain = line[2:].strip().lower()
                         # Map CONTEXT_BUDGET.md phrases to YAML config keywords
-                        if 'value judgment' in domain:
-                            extracted.extend(['value judgment', 'moral', 'ethics', 'ethical'])
-                        elif 'moral' in domain or 'tradeoff' in domain:
-                            extracted.extend(['moral', 'ethics', 'ethical'])
-                        elif 'irreversible harm' in domain:
-                            extracted.extend(['irreversible harm', 'permanent damage'])
-                        elif 'audit trail' in domain or 'without audit' in domain or 'no audit' in domain:
-                            extracted.extend(['without audit', 'no audit trail', 'no logging'])
+                        for phrase, keywords in _FORBIDDEN_DOMAIN_MAP:
+                            if phrase in domain:
+                                extracted.extend(keywords)
+                                break
                         else:
                             # Extract key words from the domain description
                             words = domain.split()
@@ -648,29 +1162,53 @@ def check_automation_creep(
                 if extracted:
                     # Merge with YAML config, removing duplicates while preserving order
                     # YAML config takes precedence for exact matches
-                    all_domains = forbidden_domains + [d for d in extracted if d not in forbidden_domains]
-                    extracted_forbidden_domains = list(dict.fromkeys(all_domains))  # Remove duplicates, preserve order
+                    extracted_forbidden_domains = list(dict.fromkeys(chain(forbidden_domains, extracted)))  # Remove duplicates, preserve order
     
     # Use extracted domains (from CONTEXT_BUDGET.md if found, otherwise YAML config)
     forbidden_domains_to_use = extracted_forbidden_domains
     
     # Parse decision log entries
-    decision_log_text = read_text(decision_log)
-    entries = parse_decision_log_entries(decision_log_text)
+    entries = parse_decision_log_entries_cached(decision_log)
     
     if not entries:
         return [Finding("INFO", "LOAD_AUTOMATION_CREEP_NO_ENTRIES", "No decision log entries found; skipping automation creep check.")]
     
-    # Check each entry for automation keywords and forbidden domains
+    # Check each entry for automation keywords and forbidden domains. A single
+    # alternation per list rules out most entries in one regex pass; the
+    # per-keyword scans below only run on entries that matched.
+    automation_re = marker_regex(tuple(automation_keywords))
+    forbidden_re = marker_regex(tuple(forbidden_domains_to_use))
+    # Lowercase the keyword lists once rather than once per entry
+    automation_pairs = [(keyword, keyword.lower()) for keyword in automation_keywords]
+    forbidden_pairs = [(domain, domain.lower()) for domain in forbidden_domains_to_use]
+    
+    # Both must match, so test the shorter list first: it is cheaper to scan
+    # and usually the more selective of the two
+    first_re, second_re = automation_re, forbidden_re
+    if len(forbidden_pairs) < len(automation_pairs):
+        first_re, second_re = forbidden_re, automation_re
+    
+    # Entries are slices of the log, so if the whole log lacks a match for the
+    # second list no entry can be a violation. Otherwise the first list is
+    # matched against all entries in one batched pass.
+    candidate_indices: List[int] = []
+    if first_re and second_re and second_re.search(read_text_cached(decision_log)):
+        candidate_indices = matching_indices(first_re, [entry.text for entry in entries])
+    
     violations = []
-    for idx, entry in enumerate(entries, start=1):
-        entry_lower = entry.lower()
+    truncated = False
+    for position, entry_idx in enumerate(candidate_indices):
+        entry = entries[entry_idx]
+        idx = entry_idx + 1
+        if not second_re.search(entry.text):
+            continue
+        entry_lower = entry.text_lower
         
         # Check if entry contains automation keywords
         has_automation = False
         automation_found = []
-        for keyword in automation_keywords:
-            if keyword.lower() in entry_lower:
+        for keyword, keyword_lower in automation_pairs:
+            if keyword_lower in entry_lower:
                 has_automation = True
                 automation_found.append(keyword)
         
@@ -680,29 +1218,35 @@ def check_automation_creep(
         # Check if entry also contains forbidden domain keywords
         has_forbidden_domain = False
         forbidden_found = []
-        for domain in forbidden_domains_to_use:
-            if domain.lower() in entry_lower:
+        for domain, domain_lower in forbidden_pairs:
+            if domain_lower in entry_lower:
                 has_forbidden_domain = True
                 forbidden_found.append(domain)
         
         if has_forbidden_domain:
             # Extract relevant portion of entry for context
-            entry_preview = entry[:500] if len(entry) > 500 else entry
+            entry_preview = entry.text[:500]
             violations.append({
                 "entry_index": idx,
                 "automation_keywords": automation_found,
                 "forbidden_domains": forbidden_found,
                 "entry_preview": entry_preview
             })
+            if max_violations is not None and len(violations) >= max_violations:
+                # Enough to fail; the rest of the log cannot change the outcome
+                truncated = position < len(candidate_indices) - 1
+                break
     
     if violations:
+        count = f"at least {len(violations)}" if truncated else str(len(violations))
         findings.append(Finding(
             "HARD_FAIL",
             "LOAD_AUTOMATION_CREEP_VIOLATION",
-            f"Automation creep detected: {len(violations)} decision log entry(ies) automate forbidden human-judgment domains.",
+            f"Automation creep detected: {count} decision log entry(ies) automate forbidden human-judgment domains.",
             {
                 "violations": violations[:20],  # Limit to first 20 for readability
                 "count": len(violations),
+                "truncated": truncated,
                 "note": "Automation must not expand into value judgments, moral tradeoffs, irreversible harm, or actions without audit trail per CONTEXT_BUDGET.md"
             }
         ))
@@ -715,65 +1259,94 @@ def check_automation_creep(
 # Rule Contradiction Detection Helpers
 # ----------------------------
 
-@dataclass
+# Checked in order, so negated forms come before their positive keyword
+NORMATIVE_KEYWORDS = ("MUST NOT", "MUST", "SHOULD NOT", "SHOULD", "MAY")
+
+# Case-insensitive substring match for any normative keyword. No keyword's
+# suffix is another's prefix, so findall() never hides one behind another.
+_RE_NORMATIVE = re.compile("|".join(NORMATIVE_KEYWORDS), re.IGNORECASE)
+
+class _PunctuationTable(dict):
+    """str.translate table deleting what the regex [^\\w\\s] matches, filled in per character on first use."""
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char == "_" or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+_PUNCTUATION_TABLE = _PunctuationTable()
+
+# Common words that don't affect a rule subject's meaning
+SUBJECT_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can', 'cannot'
+})
+
+@dataclass(frozen=True, slots=True)
 class Rule:
-    """Represents a parsed rule."""
+    """Represents a parsed rule (immutable and slotted, so it needs no per-instance __dict__)."""
     rule_id: str
     text: str
     file_path: Path
     line_number: int
     normative_keyword: str
 
-def extract_rules_from_files(rule_files: List[Path]) -> List[Rule]:
-    """Extract all rules from governance files."""
+def extract_rules_from_file(rule_file: Path) -> List[Rule]:
+    """Extract all rules from one governance file."""
     rules = []
-    # Rule ID pattern from lil_os.rule_id.yaml
-    rule_id_pattern = re.compile(r'\[LIL-(MR|GOV|CB|RT|WF|QL|SEC|DATA|API|PERF|CR)-(BOUNDARY|AUTH|PROCESS|SAFETY|SCOPE|FORMAT|BUDGET|LOG|RESET)-\d{4}\]')
-    normative_keywords = ["MUST NOT", "MUST", "SHOULD NOT", "SHOULD", "MAY"]
-    
-    for rule_file in rule_files:
-        if not rule_file.exists():
+    # A missing file reads as empty and yields no rules
+    text = read_text_cached(rule_file)
+    if "[LIL-" not in text:
+        return rules
+    # Search the whole file once and resolve each match to its line through
+    # the newline index, instead of running the regex on every line separately
+    offsets = newline_offsets(text)
+    prev_line_num = 0
+    for rule_id_match in _RE_RULE_ID.finditer(text):
+        newlines_before = bisect.bisect_left(offsets, rule_id_match.start())
+        line_num = newlines_before + 1
+        if line_num == prev_line_num:
+            # Only the first rule ID on a line counts
             continue
+        prev_line_num = line_num
+        line_start = offsets[newlines_before - 1] + 1 if newlines_before else 0
+        line_end = offsets[newlines_before] if newlines_before < len(offsets) else len(text)
+        line = text[line_start:line_end]
         
-        text = read_text(rule_file)
-        for line_num, line in enumerate(text.splitlines(), start=1):
-            # Find rule ID in line
-            rule_id_match = rule_id_pattern.search(line)
-            if not rule_id_match:
-                continue
-            
-            rule_id = rule_id_match.group(0)
-            
-            # Find normative keyword
-            normative_keyword = None
-            for keyword in normative_keywords:
-                if keyword in line.upper():
-                    normative_keyword = keyword
-                    break
-            
-            if normative_keyword:
-                rules.append(Rule(
-                    rule_id=rule_id,
-                    text=line.strip(),
-                    file_path=rule_file,
-                    line_number=line_num,
-                    normative_keyword=normative_keyword
-                ))
+        rule_id = rule_id_match.group(0)
+        
+        # Find normative keyword: one scan collects every keyword on the
+        # line, then the highest-priority one wins
+        found = {m.upper() for m in _RE_NORMATIVE.findall(line)}
+        normative_keyword = next((k for k in NORMATIVE_KEYWORDS if k in found), None)
+        
+        if normative_keyword:
+            rules.append(Rule(
+                rule_id=rule_id,
+                text=line.strip(),
+                file_path=rule_file,
+                line_number=line_num,
+                normative_keyword=normative_keyword
+            ))
     
     return rules
 
+def extract_rules_from_files(rule_files: List[Path]) -> List[Rule]:
+    """Extract all rules from governance files, reading and scanning them concurrently."""
+    return list(chain.from_iterable(map_files(extract_rules_from_file, rule_files)))
+
 def extract_rule_subject(rule: Rule) -> str:
     """Extract the subject of a rule (what the rule is about)."""
     # Remove rule ID
     text = rule.text
-    text = re.sub(r'\[LIL-[^\]]+\]', '', text)
+    text = _RE_ANY_RULE_ID.sub('', text)
     
     # Remove normative keywords
-    for keyword in ["MUST NOT", "MUST", "SHOULD NOT", "SHOULD", "MAY"]:
+    for keyword in NORMATIVE_KEYWORDS:
         text = text.replace(keyword, '')
     
     # Normalize: lowercase, remove extra spaces, remove leading/trailing punctuation
-    text = re.sub(r'\s+', ' ', text).strip().lower()
+    text = ' '.join(text.split()).lower()
     text = text.strip('.,;:')
     
     return text
@@ -781,15 +1354,13 @@ def extract_rule_subject(rule: Rule) -> str:
 def normalize_subject(subject: str) -> str:
     """Normalize rule subjects for comparison."""
     # Remove common words that don't affect meaning
-    stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can', 'cannot'}
-    
     words = subject.split()
-    filtered_words = [w for w in words if w not in stop_words]
+    filtered_words = [w for w in words if w not in SUBJECT_STOP_WORDS]
     
     # Join and normalize
     normalized = ' '.join(filtered_words)
-    normalized = re.sub(r'[^\w\s]', '', normalized)  # Remove punctuation
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    normalized = normalized.translate(_PUNCTUATION_TABLE)  # Remove punctuation
+    normalized = ' '.join(normalized.split())
     
     return normalized
 
@@ -809,14 +1380,15 @@ def check_rule_contradiction(rule_files: List[Path], enabled: bool, use_enhanced
     if len(rules) < 2:
         return [Finding("INFO", "DRIFT_RULE_CONTRADICTION_OK", "Not enough rules to check for contradictions (need at least 2).")]
     
-    # Extract subjects and normalize
-    rule_subjects = {}
+    # Extract subjects and normalize; the subject only depends on the rule
+    # text, so repeated texts are normalized once
+    rule_subjects = defaultdict(list)
+    subjects_by_text = {}
     for rule in rules:
-        subject = extract_rule_subject(rule)
-        normalized = normalize_subject(subject)
-        
-        if normalized not in rule_subjects:
-            rule_subjects[normalized] = []
+        normalized = subjects_by_text.get(rule.text)
+        if normalized is None:
+            normalized = normalize_subject(extract_rule_subject(rule))
+            subjects_by_text[rule.text] = normalized
         rule_subjects[normalized].append(rule)
     
     # Check for contradictions
@@ -827,14 +1399,16 @@ def check_rule_contradiction(rule_files: List[Path], enabled: bool, use_enhanced
         if len(subject_rules) < 2:
             continue
         
+        # Bucket the subject's rules by normative keyword in one pass
+        by_keyword = {keyword: [] for keyword in NORMATIVE_KEYWORDS}
+        for r in subject_rules:
+            by_keyword[r.normative_keyword].append(r)
+        
         # Check for MUST NOT vs MUST
-        has_must_not = any(r.normative_keyword == "MUST NOT" for r in subject_rules)
-        has_must = any(r.normative_keyword == "MUST" for r in subject_rules)
+        must_not_rules = by_keyword["MUST NOT"]
+        must_rules = by_keyword["MUST"]
         
-        if has_must_not and has_must:
-            must_not_rules = [r for r in subject_rules if r.normative_keyword == "MUST NOT"]
-            must_rules = [r for r in subject_rules if r.normative_keyword == "MUST"]
-            
+        if must_not_rules and must_rules:
             contradictions.append({
                 "type": "HARD_CONTRADICTION",
                 "subject": normalized_subject,
@@ -844,13 +1418,10 @@ def check_rule_contradiction(rule_files: List[Path], enabled: bool, use_enhanced
             })
         
         # Check for SHOULD NOT vs SHOULD (weaker contradiction)
-        has_should_not = any(r.normative_keyword == "SHOULD NOT" for r in subject_rules)
-        has_should = any(r.normative_keyword == "SHOULD" for r in subject_rules)
+        should_not_rules = by_keyword["SHOULD NOT"]
+        should_rules = by_keyword["SHOULD"]
         
-        if has_should_not and has_should:
-            should_not_rules = [r for r in subject_rules if r.normative_keyword == "SHOULD NOT"]
-            should_rules = [r for r in subject_rules if r.normative_keyword == "SHOULD"]
-            
+        if should_not_rules and should_rules:
             contradictions.append({
                 "type": "SOFT_CONTRADICTION",
                 "subject": normalized_subject,
@@ -859,15 +1430,20 @@ def check_rule_contradiction(rule_files: List[Path], enabled: bool, use_enhanced
                 "should_rules": [{"id": r.rule_id, "file": str(r.file_path), "line": r.line_number} for r in should_rules]
             })
     
-    # Check for explicit contradiction markers
+    # Check for explicit contradiction markers. Rules are indexed by ID,
+    # keeping the first occurrence of a duplicated ID.
+    rules_by_id = {}
     for rule in rules:
+        rules_by_id.setdefault(rule.rule_id, rule)
+    # Few rules carry a marker, so find candidates in one batched search
+    for rule_idx in matching_indices(_RE_CONTRADICTS, [rule.text for rule in rules]):
+        rule = rules[rule_idx]
         # Look for patterns like "contradicts [LIL-XXX-YYY-0001]"
-        contradiction_pattern = re.compile(r'contradicts\s+(\[LIL-[^\]]+\])', re.IGNORECASE)
-        match = contradiction_pattern.search(rule.text)
+        match = _RE_CONTRADICTS.search(rule.text)
         if match:
             referenced_id = match.group(1)
             # Check if referenced rule exists
-            referenced_rule = next((r for r in rules if r.rule_id == referenced_id), None)
+            referenced_rule = rules_by_id.get(referenced_id)
             if referenced_rule:
                 contradictions.append({
                     "type": "EXPLICIT_CONTRADICTION",
@@ -956,79 +1532,123 @@ def main() -> int:
     findings: List[Finding] = []
     
     # Wrap checks in timer context
+    rule_velocity_days = int(windows.get("rule_velocity_days", 30))
+    
+    git_window_days = max(rule_velocity_days, GOVERNANCE_WINDOW_DAYS)
+    
+    # Extract lists from conventions (normalize YAML parser output)
+    automation_keywords = normalize_yaml_list(conventions.get("automation_keywords", []))
+    forbidden_domains = normalize_yaml_list(conventions.get("forbidden_domains", []))
+    security = cfg.get("security", {})
+    
     with timer:
-        findings += check_rule_accretion_velocity(int(windows.get("rule_velocity_days", 30)))
-        findings += check_rule_contradiction(
-            rule_files=[master_rules, governance, context_budget, cursor_rules],
-            enabled=bool(cfg.get("checks", {}).get("check_rule_contradiction", True)),
-            use_enhanced=bool(cfg.get("checks", {}).get("use_enhanced_contradiction_detection", False))
-        )
-        findings += check_justification_decay(
-            decision_log=decision_log,
-            required_fields=normalize_yaml_list(conventions.get("decision_log_required_fields", [])),
-            incomplete_threshold=int(thresholds.get("justification_decay_incomplete_entries", 2)),
-            rolling_entries=int(windows.get("decision_log_rolling_entries", 20)),
-        )
-        findings += check_context_budget_overflow(
-            rule_files=[master_rules, governance, context_budget, cursor_rules],
-            agents_dir=agents_dir,
-            memory_dir=memory_dir,
-            max_rules=int(thresholds.get("max_rules", 120)),
-            max_agents=int(thresholds.get("max_agents", 8)),
-            max_memory=int(thresholds.get("max_memory_artifacts", 200)),
-        )
-        findings += check_silent_memory_growth(
-            memory_dir=memory_dir,
-            required_meta=normalize_yaml_list(conventions.get("memory_required_metadata", [])),
-        )
-        # Extract lists from conventions (normalize YAML parser output)
-        automation_keywords = normalize_yaml_list(conventions.get("automation_keywords", []))
-        forbidden_domains = normalize_yaml_list(conventions.get("forbidden_domains", []))
+        # One git log serves every git-based check; it runs in the background
+        # while the filesystem-bound checks do their work
+        git_proc = GitContext.start(git_window_days)
         
-        findings += check_automation_creep(
-            decision_log=decision_log,
-            context_budget=context_budget,
-            automation_keywords=automation_keywords,
-            forbidden_domains=forbidden_domains,
-            enabled=bool(cfg.get("checks", {}).get("check_automation_creep", True))
-        )
-        findings += check_override_normalization(
-            decision_log=decision_log,
-            override_markers=normalize_yaml_list(conventions.get("override_markers", [])),
-            per_window_threshold=int(thresholds.get("override_normalization_per_window", 2)),
-        )
-        findings += check_metric_dominance(
-            decision_log=decision_log,
-            metric_markers=normalize_yaml_list(conventions.get("metric_markers", [])),
-            consecutive_threshold=int(thresholds.get("metric_dominance_consecutive_decisions", 3)),
-        )
-        findings += check_explanation_failure_marker()
-        
-        # Security checks
-        security = cfg.get("security", {})
-        findings += check_decision_log_integrity(
-            decision_log=decision_log,
-            enabled=bool(security.get("check_decision_log_integrity", True))
-        )
-        findings += check_governance_file_changes(
-            governance_files=[master_rules, governance, Path(paths.get("reset_triggers", "docs/RESET_TRIGGERS.md"))],
-            decision_log=decision_log,
-            enabled=bool(security.get("check_governance_file_changes", True))
-        )
-        findings += check_secret_detection(
-            decision_log=decision_log,
-            scan_paths=[decision_log, Path(paths.get("docs_dir", "docs"))],
-            secret_patterns=normalize_yaml_list(security.get("secret_patterns", [])),
-            enabled=bool(security.get("check_secrets", True))
-        )
-        findings += check_script_checksums(
-            script_paths=[
-                Path("scripts/lil_os_rule_id_lint.py"),
-                Path("scripts/lil_os_reset_checks.py")
-            ],
-            expected_checksums=security.get("script_checksums", {}),
-            enabled=bool(security.get("check_script_checksums", False))  # Disabled by default
-        )
+        # The checks are independent and mostly wait on file reads and git, so
+        # they run concurrently; findings are still collected in a fixed order.
+        # Tasks only wait on futures submitted before them, which the pool has
+        # already started, so the waits cannot deadlock.
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix=_CHECK_THREAD_PREFIX) as executor:
+            git_future = executor.submit(GitContext.collect, git_proc, git_window_days)
+            # Walk the memory directory once for both the budget and metadata checks
+            memory_future = executor.submit(walk_files, memory_dir)
+            
+            accretion = executor.submit(
+                lambda: check_rule_accretion_velocity(rule_velocity_days, git_future.result())
+            )
+            contradiction = executor.submit(
+                check_rule_contradiction,
+                rule_files=[master_rules, governance, context_budget, cursor_rules],
+                enabled=bool(cfg.get("checks", {}).get("check_rule_contradiction", True)),
+                use_enhanced=bool(cfg.get("checks", {}).get("use_enhanced_contradiction_detection", False))
+            )
+            decision_log_checks = executor.submit(
+                run_decision_log_checks,
+                decision_log=decision_log,
+                required_fields=normalize_yaml_list(conventions.get("decision_log_required_fields", [])),
+                incomplete_threshold=int(thresholds.get("justification_decay_incomplete_entries", 2)),
+                rolling_entries=int(windows.get("decision_log_rolling_entries", 20)),
+                override_markers=normalize_yaml_list(conventions.get("override_markers", [])),
+                per_window_threshold=int(thresholds.get("override_normalization_per_window", 2)),
+                metric_markers=normalize_yaml_list(conventions.get("metric_markers", [])),
+                consecutive_threshold=int(thresholds.get("metric_dominance_consecutive_decisions", 3)),
+            )
+            budget = executor.submit(
+                lambda: check_context_budget_overflow(
+                    rule_files=[master_rules, governance, context_budget, cursor_rules],
+                    agents_dir=agents_dir,
+                    memory_dir=memory_dir,
+                    max_rules=int(thresholds.get("max_rules", 120)),
+                    max_agents=int(thresholds.get("max_agents", 8)),
+                    max_memory=int(thresholds.get("max_memory_artifacts", 200)),
+                    memory_files=memory_future.result(),
+                )
+            )
+            memory_growth = executor.submit(
+                lambda: check_silent_memory_growth(
+                    memory_dir=memory_dir,
+                    required_meta=normalize_yaml_list(conventions.get("memory_required_metadata", [])),
+                    memory_files=memory_future.result(),
+                )
+            )
+            automation_creep = executor.submit(
+                check_automation_creep,
+                decision_log=decision_log,
+                context_budget=context_budget,
+                automation_keywords=automation_keywords,
+                forbidden_domains=forbidden_domains,
+                enabled=bool(cfg.get("checks", {}).get("check_automation_creep", True))
+            )
+            
+            # Security checks
+            integrity = executor.submit(
+                lambda: check_decision_log_integrity(
+                    decision_log=decision_log,
+                    enabled=bool(security.get("check_decision_log_integrity", True)),
+                    git_ctx=git_future.result()
+                )
+            )
+            governance_changes = executor.submit(
+                lambda: check_governance_file_changes(
+                    governance_files=[master_rules, governance, Path(paths.get("reset_triggers", "docs/RESET_TRIGGERS.md"))],
+                    decision_log=decision_log,
+                    enabled=bool(security.get("check_governance_file_changes", True)),
+                    git_ctx=git_future.result()
+                )
+            )
+            secrets = executor.submit(
+                check_secret_detection,
+                decision_log=decision_log,
+                scan_paths=[decision_log, Path(paths.get("docs_dir", "docs"))],
+                secret_patterns=normalize_yaml_list(security.get("secret_patterns", [])),
+                enabled=bool(security.get("check_secrets", True))
+            )
+            checksums = executor.submit(
+                check_script_checksums,
+                script_paths=[
+                    Path("scripts/lil_os_rule_id_lint.py"),
+                    Path("scripts/lil_os_reset_checks.py")
+                ],
+                expected_checksums=security.get("script_checksums", {}),
+                enabled=bool(security.get("check_script_checksums", False))  # Disabled by default
+            )
+            
+            decay_findings, override_findings, metric_findings = decision_log_checks.result()
+            findings += accretion.result()
+            findings += contradiction.result()
+            findings += decay_findings
+            findings += budget.result()
+            findings += memory_growth.result()
+            findings += automation_creep.result()
+            findings += override_findings
+            findings += metric_findings
+            findings += check_explanation_failure_marker()
+            findings += integrity.result()
+            findings += governance_changes.result()
+            findings += secrets.result()
+            findings += checksums.result()
 
     # Print findings using OS-like formatting (returns exit code)
     exit_code = print_findings(findings)
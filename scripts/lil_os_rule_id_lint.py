@@ -11,6 +11,7 @@ Checks:
 """
 
 from __future__ import annotations
+import os
 import re
 import sys
 import json
@@ -26,7 +27,7 @@ sys.path.insert(0, str(lil_os_dir.parent))
 
 # Import shared utilities
 from lil_os_utils import (
-    Finding, load_simple_yaml, read_text, Colors,
+    Finding, load_simple_yaml, iter_file_entries, read_text, Colors,
     Timer, print_startup_banner, print_success_message, generate_report, save_report,
     print_os_error, format_os_finding, print_os_message, normalize_yaml_list
 )
@@ -69,16 +70,22 @@ def iter_sources(scan_paths: List[str], exclude_paths: List[str] = None) -> List
             if path.resolve() not in exclude_set:
                 out.append(path)
         elif path.is_dir():
-            for x in path.rglob("*"):
-                if x.is_file() and x.suffix.lower() == ".md" and x.resolve() not in exclude_set:
+            for entry in iter_file_entries(path):
+                # splitext matches Path.suffix, including for dotfiles such as ".md"
+                if os.path.splitext(entry.name)[1].lower() != ".md":
+                    continue
+                x = Path(entry.path)
+                if not exclude_set or x.resolve() not in exclude_set:
                     out.append(x)
         else:
             continue
     return out
 
+_RE_WHITESPACE = re.compile(r"\s+")
+
 def normalize_rule_text(line: str, rule_id: str) -> str:
     s = line.replace(rule_id, "")
-    s = re.sub(r"\s+", " ", s).strip().lower()
+    s = _RE_WHITESPACE.sub(" ", s).strip().lower()
     return s
 
 def main() -> int:
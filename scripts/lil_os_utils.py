@@ -10,13 +10,15 @@ Dependencies: Python 3.10+ (standard library only)
 
 from __future__ import annotations
 
+import os
+import re
 import time
 import json
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Iterator, List, Optional, Tuple, Dict, Any
 
 
 # ----------------------------
@@ -52,9 +54,9 @@ class Colors:
 # ----------------------------
 # Finding Dataclass
 # ----------------------------
-@dataclass
+@dataclass(slots=True)
 class Finding:
-    """Represents a validation finding or check result."""
+    """Represents a validation finding or check result (slotted: checks create many)."""
     level: str  # HARD_FAIL | WARN | INFO
     code: str
     message: str
@@ -64,6 +66,31 @@ class Finding:
 # ----------------------------
 # YAML Parser
 # ----------------------------
+def _parse_yaml_value(v: str):
+    """Parse a YAML value, handling types and escape sequences."""
+    v = v.strip()
+    # Integer
+    if v.isdigit():
+        return int(v)
+    # Boolean
+    lowered = v.lower()
+    if lowered == 'true':
+        return True
+    if lowered == 'false':
+        return False
+    # Quoted strings
+    if v and v[0] == v[-1] and v[0] in '"\'':
+        result = v[1:-1]
+        # Handle escape sequences for double-quoted strings (YAML-style)
+        if v[0] == '"':
+            # Unescape common regex patterns
+            result = result.replace('\\[', '[').replace('\\]', ']')
+            result = result.replace('\\d', r'\d')
+            result = result.replace('\\\\', '\\')
+        return result
+    return v
+
+
 def load_simple_yaml(path: Path) -> dict:
     """
     Simple YAML parser for LIL OS² configuration files.
@@ -79,37 +106,17 @@ def load_simple_yaml(path: Path) -> dict:
     For complex YAML, use a proper YAML library.
     """
     text = path.read_text(encoding="utf-8")
-    lines = [ln.rstrip("\n") for ln in text.splitlines() if ln.strip() and not ln.strip().startswith("#")]
     root: dict = {}
     stack: List[Tuple[int, dict | list]] = [(0, root)]
     current_key_stack: List[Optional[str]] = [None]
 
-    def parse_value(v: str):
-        """Parse a YAML value, handling types and escape sequences."""
-        v = v.strip()
-        # Integer
-        if v.isdigit():
-            return int(v)
-        # Boolean
-        if v.lower() == 'true':
-            return True
-        if v.lower() == 'false':
-            return False
-        # Quoted strings
-        if (v.startswith('"') and v.endswith('"')) or (v.startswith("'") and v.endswith("'")):
-            result = v[1:-1]
-            # Handle escape sequences for double-quoted strings (YAML-style)
-            if v.startswith('"'):
-                # Unescape common regex patterns
-                result = result.replace('\\[', '[').replace('\\]', ']')
-                result = result.replace('\\d', r'\d')
-                result = result.replace('\\\\', '\\')
-            return result
-        return v
-
-    for ln in lines:
-        indent = len(ln) - len(ln.lstrip(" "))
-        ln = ln.lstrip(" ")
+    for raw in text.splitlines():
+        # Single pass: each line is stripped once and blank/comment lines skipped
+        ln = raw.lstrip(" ")
+        stripped = ln.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+        indent = len(raw) - len(ln)
         while stack and indent < stack[-1][0]:
             stack.pop()
             current_key_stack.pop()
@@ -117,7 +124,7 @@ def load_simple_yaml(path: Path) -> dict:
         container = stack[-1][1]
 
         if ln.startswith("- "):
-            item = parse_value(ln[2:])
+            item = _parse_yaml_value(ln[2:])
             if not isinstance(container, list):
                 key = current_key_stack[-1]
                 if key is None or not isinstance(container, dict):
@@ -130,8 +137,8 @@ def load_simple_yaml(path: Path) -> dict:
             container.append(item)
             continue
 
-        if ":" in ln:
-            key, rest = ln.split(":", 1)
+        key, sep, rest = ln.partition(":")
+        if sep:
             key = key.strip()
             rest = rest.strip()
             if isinstance(container, list):
@@ -141,7 +148,7 @@ def load_simple_yaml(path: Path) -> dict:
                 stack.append((indent + 2, container[key]))
                 current_key_stack.append(key)
             else:
-                container[key] = parse_value(rest)
+                container[key] = _parse_yaml_value(rest)
                 current_key_stack[-1] = key
             continue
 
@@ -150,6 +157,7 @@ def load_simple_yaml(path: Path) -> dict:
     return root
 
 
+
 def normalize_yaml_list(value: dict | list) -> list:
     """
     Normalize YAML parser output for list values.
@@ -194,6 +202,31 @@ def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="replace")
 
 
+def iter_file_entries(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield DirEntry objects for files under root recursively (same order as Path.rglob).
+
+    Uses os.scandir so file/directory checks reuse the cached DirEntry type
+    instead of issuing a stat() per path. Directory symlinks are not followed.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+        # Depth-first, visiting subdirectories in listing order
+        stack.extend(reversed(subdirs))
+
+
 # ----------------------------
 # Timing Utilities
 # ----------------------------
@@ -501,6 +534,10 @@ def print_os_error(finding: Finding, include_actions: bool = True):
         print()
 
 
+# Pattern to match ANSI escape sequences
+_RE_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
 def strip_ansi(text: str) -> str:
     """
     Remove ANSI escape sequences from a string.
@@ -511,10 +548,7 @@ def strip_ansi(text: str) -> str:
     Returns:
         String with ANSI codes removed
     """
-    import re
-    # Pattern to match ANSI escape sequences
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    return _RE_ANSI_ESCAPE.sub('', text)
 
 
 def print_os_box(title: str, content: List[str], width: int = 60, show_separator: bool = True):
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Tests for the reset checks script."""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import lil_os_reset_checks as reset_checks
+from lil_os_reset_checks import GitContext
+
+
+# Captured from `git log -z --numstat --format=%x1e%H%x1f%ct%x1f%ai%x1f%s`
+# over a binary change, an empty commit, a rename and an initial commit
+GIT_LOG_OUTPUT = (
+    b"\x1e28f6afe32ec824199c941850be32d5c393707bae\x1f1704362400\x1f2024-01-04 10:00:00 +0000\x1fBinary\0"
+    b"\n-\t-\tlogo.png\0"
+    b"\x1ed4713657c4154c72baa212debf313f8f39fd49f8\x1f1704276000\x1f2024-01-03 10:00:00 +0000\x1fEmpty\0"
+    b"\x1e10c1076e22087262555b140f1c07e6ebc46372f6\x1f1704189600\x1f2024-01-02 10:00:00 +0000\x1fRename | pipe\0"
+    b"\n1\t0\t\0docs/GOVERNANCE.md\0docs/RULES.md\0"
+    b"\x1ef77f701d2896a9028a1013312a026f65afb3b5b7\x1f1704103200\x1f2024-01-01 10:00:00 +0000\x1fAdd governance\0"
+    b"\n2\t0\tdocs/GOVERNANCE.md\0"
+    b"-\t-\tlogo.png\0"
+)
+
+
+def test_git_context_log_parsing(monkeypatch):
+    """Test parsing of the shared `git log -z --numstat` stream into a GitContext."""
+    # A tiny read size splits records across chunks
+    monkeypatch.setattr(reset_checks, "_GIT_READ_CHUNK_SIZE", 7)
+    ctx = GitContext._parse_log(reset_checks.iter_nul_records(io.BytesIO(GIT_LOG_OUTPUT)), 30)
+    ctx.root = Path("/repo")
+
+    assert ctx.available
+    assert [c["message"] for c in ctx.commits] == ["Binary", "Empty", "Rename | pipe", "Add governance"]
+    binary, empty, rename, initial = ctx.commits
+    assert binary["hash"] == "28f6afe32ec824199c941850be32d5c393707bae"
+    assert binary["timestamp"] == 1704362400
+    assert binary["date"] == "2024-01-04 10:00:00 +0000"
+    # Binary files report "-" and add no line counts
+    assert (binary["added"], binary["deleted"]) == (0, 0)
+    assert (empty["added"], empty["deleted"]) == (0, 0)
+    assert (rename["added"], rename["deleted"]) == (1, 0)
+    assert (initial["added"], initial["deleted"]) == (2, 0)
+
+    # Renames are recorded under both the old and the new path
+    assert ctx.per_file_commits["docs/GOVERNANCE.md"] == [rename, initial]
+    assert ctx.per_file_commits["docs/RULES.md"] == [rename]
+    assert ctx.per_file_commits["logo.png"] == [binary, initial]
+    assert "" not in ctx.per_file_commits
+
+    # Paths are keyed relative to the repository root
+    assert ctx.commits_for(Path("/repo/docs/RULES.md"), 30) == [rename]
+    assert ctx.commits_for(Path("/repo/docs/MISSING.md"), 30) == []
+
+    # The full window covers every commit; shorter windows use commit times
+    assert ctx.changed_lines_since(30) == (3, 0)
+    assert ctx.changed_lines_since(7) == (0, 0)
+    assert ctx.commits_for(Path("/repo/logo.png"), 7) == []
+
+
+def test_git_context_unavailable():
+    """Test that a missing or failing git log yields an unavailable context."""
+    assert not GitContext.collect(None, 30).available
+
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import sys; sys.stdout.write('partial'); sys.exit(1)"],
+        stdout=subprocess.PIPE
+    )
+    ctx = GitContext.collect(proc, 30)
+    assert not ctx.available
+    assert ctx.commits == []
+
+
+def _governance_commit(commit_hash, message="Update governance"):
+    return {"hash": commit_hash, "timestamp": 1704880800, "date": "2024-01-10 10:00:00 +0000",
+            "message": message, "added": 1, "deleted": 0}
+
+
+def test_governance_changes_matched_by_commit_hash(tmp_path):
+    """Test the abbreviated-hash index used to match governance commits to log entries."""
+    governance = tmp_path / "docs" / "GOVERNANCE.md"
+    governance.parent.mkdir()
+    governance.write_text("# Governance\n")
+    decision_log = tmp_path / "docs" / "DECISION_LOG.md"
+
+    full_hash = "a1b2c3d4" + "e5" * 16
+    stale_hash = "bbbbbbbb" + "0" * 32
+    upper_hash = "cccccccc" + "1" * 32
+    embedded_hash = "dddddddd" + "2" * 32
+    commits = [
+        _governance_commit(full_hash),
+        _governance_commit(stale_hash),
+        _governance_commit(upper_hash),
+        _governance_commit(embedded_hash),
+        _governance_commit("eeeeeeee" + "3" * 32, message="Initial commit"),
+    ]
+    git_ctx = GitContext(available=True, window_days=30, root=tmp_path,
+                         per_file_commits={"docs/GOVERNANCE.md": commits})
+
+    def entry(title, day, body):
+        # Offset-aware like the commit dates, so the 7-day window applies
+        return f"## {title}\nDate: 2024-{day} 00:00:00 +0000\nDecision: {body}\n"
+
+    decision_log.write_text(
+        entry("Full hash", "01-12", f"Recorded in {full_hash}.")
+        + entry("Too old", "03-01", "Follows up on bbbbbbbb.")
+        + entry("Uppercase", "01-12", "Follows up on CCCCCCCC.")
+        + entry("Embedded", "01-12", "Range 0123dddddddd4567.")
+    )
+    findings = reset_checks.check_governance_file_changes([governance], decision_log, True, git_ctx)
+    assert [f.code for f in findings] == ["SEC_GOVERNANCE_FILE_CHANGES_UNLOGGED"]
+    # Hashes match as case-sensitive substrings of an entry, within 7 days;
+    # initial commits never need an entry
+    unlogged = [change["commit_hash"] for change in findings[0].details["unlogged_changes"]]
+    assert unlogged == [stale_hash, upper_hash]
+
+    # An entry naming the governance file covers every nearby modification
+    decision_log.write_text(entry("Rules", "01-11", "Reworded governance.md."))
+    findings = reset_checks.check_governance_file_changes([governance], decision_log, True, git_ctx)
+    assert [f.code for f in findings] == ["SEC_GOVERNANCE_FILE_CHECKS_OK"]
+
+
+def test_matching_indices():
+    """Test that the joined-text search reports the same texts as searching each one."""
+    pattern = reset_checks.marker_regex(("deploy", "auto-merge"))
+    texts = ["", "Deploy nightly", "nothing here", "deploy and deploy again", "", "AUTO-MERGE", "dep", "loy", "deploy"]
+    expected = [idx for idx, text in enumerate(texts) if pattern.search(text)]
+    assert reset_checks.matching_indices(pattern, texts) == expected == [1, 3, 5, 8]
+    # Matches never span the boundary between two texts
+    assert reset_checks.matching_indices(reset_checks.marker_regex(("deploy",)), ["dep", "loy"]) == []
+    assert reset_checks.matching_indices(pattern, []) == []
+
+    rules = ["[LIL-GOV-AUTH-0001] Agents MUST ask.", "contradicts [LIL-GOV-AUTH-0001]", "Contradicts [LIL-X]"]
+    assert reset_checks.matching_indices(reset_checks._RE_CONTRADICTS, rules) == [1, 2]
+
+
+def test_substring_flags():
+    """Test that substring_flags agrees with a substring test per text and needle list."""
+    texts = ["override used", "", "emergency override", "metric: latency", "kpi: uptime and override", "over", "ride"]
+    needle_lists = [["override", "emergency override"], ["metric:", "kpi:"], ["override"], [], ["overr"], [""]]
+    expected = [[any(needle in text for needle in needles) for text in texts] for needles in needle_lists]
+    assert reset_checks.substring_flags(texts, needle_lists) == expected
+    assert expected[0] == [True, False, True, False, True, False, False]
+    # Needles never match across the boundary between two texts
+    assert reset_checks.substring_flags(["over", "ride"], [["override"]]) == [[False, False]]
+    assert reset_checks.substring_flags([], [["override"], []]) == [[], []]
+    assert reset_checks.substring_flags(texts, [[], []]) == [[False] * len(texts)] * 2
+
+
+def test_scan_decision_log_entries_markers():
+    """Test override and metric flags for decision-log entries, matched case-insensitively."""
+    entries = [
+        reset_checks.DecisionEntry.from_text(text) for text in (
+            "Date: 2024-01-01\nDecision: EMERGENCY OVERRIDE of the freeze",
+            "Date: 2024-01-02\nDecision: ship it\nPrimary metric: latency",
+            "Date: 2024-01-03\nDecision: nothing notable",
+        )
+    ]
+    missing, override_flags, metric_flags = reset_checks.scan_decision_log_entries(
+        entries, ["Date:", "Decision:", "Rationale:"], ["Override"], ["Metric:", "KPI:"], rolling_entries=2
+    )
+    assert missing == [["Rationale:"], ["Rationale:"]]
+    assert override_flags == [True, False, False]
+    assert metric_flags == [False, True, False]
+
+
+def test_secret_detection_numbered_backreference(tmp_path):
+    """Test that a pattern with a numbered backreference still matches alongside others."""
+    notes = tmp_path / "notes.md"
+    notes.write_text("config\ntoken: xx\n")
+    findings = reset_checks.check_secret_detection(
+        tmp_path / "DECISION_LOG.md", [notes], ["ghp_[a-z]{3}", r"token: (x)\1"], True
+    )
+    assert [f.code for f in findings] == ["SEC_SECRET_DETECTED"]
+    secrets = findings[0].details["detected_secrets"]
+    assert [(s["pattern"], s["line"]) for s in secrets] == [(r"token: (x)\1", 2)]
+
+
+def test_secret_detection_counts_each_file_once(tmp_path, monkeypatch):
+    """Test that a decision log scanned both directly and via docs/ counts as one file."""
+    monkeypatch.chdir(tmp_path)
+    docs = Path("docs")
+    docs.mkdir()
+    decision_log = docs / "DECISION_LOG.md"
+    decision_log.write_text("Date: 2024-01-01\nDecision: rotate ghp_abc\n")
+    findings = reset_checks.check_secret_detection(decision_log, [decision_log, docs], ["ghp_[a-z]{3}"], True)
+    assert [f.code for f in findings] == ["SEC_SECRET_DETECTED"]
+    assert findings[0].message.startswith("Potential secrets detected in 1 file(s).")
@@ -47,3 +47,45 @@ def test_signal_storage():
         signals = storage.get_signals(source="test")
         assert len(signals) == 1
         assert signals[0].data["key"] == "value"
+
+
+def test_git_log_numstat_parsing():
+    """Test parsing of a single NUL-delimited `git log -z --numstat` invocation."""
+    collector = GitSignalCollector()
+    output = (
+        b"abc123\x1fAda\x1fada@example.com\x1f2024-01-01 10:00:00 +0000\x1fAdd feature\n"
+        b"10\t2\tsrc/app.py\0"
+        b"-\t-\tassets/logo.png\0"
+        b"\0"
+        b"def456\x1fBob\x1fbob@example.com\x1f2024-01-02 10:00:00 +0000\x1fMerge | pipe\0"
+        b"789abc\x1fBob\x1fbob@example.com\x1f2024-01-03 10:00:00 +0000\x1fRename\n"
+        b"0\t0\t\0old name.md\0new name.md\0"
+        b"1\t1\tREADME.md\0"
+    )
+    
+    commits = collector._parse_log_numstat(output.split(b"\0"))
+    assert len(commits) == 3
+    assert commits[0]["stats"] == {"additions": 10, "deletions": 2, "files_changed": 2, "total_lines": 12}
+    assert commits[0]["changed_files"] == ["src/app.py", "assets/logo.png"]
+    assert commits[1]["message"] == "Merge | pipe"
+    assert commits[1]["changed_files"] == []
+    assert commits[2]["changed_files"] == ["new name.md", "README.md"]
+    assert commits[2]["stats"]["files_changed"] == 2
+
+
+def test_report_signal_collector_skips_corrupted_reports():
+    """Test ReportSignalCollector parses valid reports and skips corrupted ones."""
+    import json
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reports_dir = Path(tmpdir)
+        (reports_dir / "a_report.json").write_text(
+            json.dumps({"check_name": "Reset Checks", "status": "pass", "findings": [{}, {}]})
+        )
+        (reports_dir / "b_report.json").write_text("{not json")
+        (reports_dir / "c_summary.md").write_text("# ignored")
+        
+        signals = ReportSignalCollector(reports_dir).collect()
+        assert len(signals) == 1
+        assert signals[0].data["check_name"] == "Reset Checks"
+        assert signals[0].data["findings_count"] == 2